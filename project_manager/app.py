@@ -1,26 +1,181 @@
 """Core application logic for the personal project manager app."""
 from __future__ import annotations
 
+import os
+import re
 import shutil
+import sqlite3
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timedelta, UTC
+from email import policy
+from email.message import EmailMessage
+from email.parser import BytesParser
 from email.utils import parseaddr
+from functools import lru_cache, partial
+from itertools import chain, groupby, repeat, starmap
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 from . import database
 from .config import RAW_EMAIL_DIR
-from .email_utils import ParsedEmail, parse_email_file, parse_raw_email
+from .email_utils import (
+    ParsedEmail,
+    display_date,
+    normalise_date,
+    parse_email_file,
+    parse_raw_email,
+)
+
+# Parsers keep no state between parse calls; reuse one for every message.
+_EMAIL_PARSER = BytesParser(policy=policy.default)
+
+
+# Legacy ``emails`` upsert shared by the single and batched write paths.
+_SQL_UPSERT_EMAIL = """
+INSERT INTO emails(message_id, subject, sender, received_at, snippet, raw_path)
+VALUES(?, ?, ?, ?, ?, ?)
+ON CONFLICT(message_id) DO UPDATE SET
+    subject = excluded.subject,
+    sender = excluded.sender,
+    received_at = excluded.received_at,
+    snippet = excluded.snippet,
+    raw_path = excluded.raw_path,
+    updated_at = datetime('now')
+"""
+
+# ``RETURNING`` (SQLite 3.35+) lets the upsert hand back the stored row directly.
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+# Contacts/communications mirror of an email, shared by the single and batched paths.
+# A known contact only gains a name when it has none yet.
+_SQL_UPSERT_CONTACT = """
+INSERT INTO contacts(name, email)
+VALUES(?, ?)
+ON CONFLICT(email) DO UPDATE SET
+    name = COALESCE(contacts.name, excluded.name),
+    updated_at = datetime('now')
+WHERE excluded.name IS NOT NULL
+"""
+
+_SQL_UPSERT_COMMUNICATION = """
+INSERT INTO communications(type, source_id, subject, snippet, timestamp, raw_path)
+VALUES('email', ?, ?, ?, ?, ?)
+ON CONFLICT(type, source_id) DO UPDATE SET
+    subject = excluded.subject,
+    snippet = excluded.snippet,
+    timestamp = excluded.timestamp,
+    raw_path = excluded.raw_path,
+    updated_at = datetime('now')
+"""
+
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER (999 on older builds) for IN (...) lookups.
+_SQL_IN_CHUNK = 500
+
+
+# Filename sanitisation: keep letters, digits, "-" and "_", replace everything else.
+_ASCII_SAFE_STEM = str.maketrans(
+    {ch: "_" for ch in map(chr, range(128)) if not (ch.isalnum() or ch in "-_")}
+)
+# ``\w`` is exactly ``str.isalnum()`` plus "_", so this matches the table for any input.
+_UNSAFE_STEM_CHARS = re.compile(r"[^\w-]")
+
+
+# Prebuilt "<raw email dir>/" prefix; storage paths are plain string concatenation.
+_RAW_EMAIL_PREFIX = os.path.join(RAW_EMAIL_DIR, "")
+
+
+def _safe_stem(message_id: str) -> str:
+    """Turn a Message-Id into a string that is safe to use as a filename stem."""
+    if message_id.isascii():
+        return message_id.translate(_ASCII_SAFE_STEM)
+    return _UNSAFE_STEM_CHARS.sub("_", message_id)
+
+
+def _sender_key(sender: str) -> str:
+    """Normalise a sender string the way ``ignored_senders`` stores it."""
+    return sender.strip().lower()
+
+
+def _utc_timestamp(moment: datetime) -> str:
+    """Format ``moment`` the way ``remind_at`` is stored.
+
+    Always UTC with a fixed-width offset, so stored values compare correctly as plain
+    text in SQL without wrapping the column in ``datetime()``.
+    """
+    return moment.astimezone(UTC).isoformat(timespec="seconds")
+
+
+# SQL expression producing the current time in the _utc_timestamp() format. SQLite
+# evaluates it once per statement, so queries need not format and bind "now" themselves.
+_SQL_UTC_NOW = "strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now')"
+
+
+def _raw_storage_path(message_id: str) -> str:
+    """Return where the raw copy of the email with ``message_id`` is stored."""
+    return f"{_RAW_EMAIL_PREFIX}{_safe_stem(message_id)}.eml"
+
+
+def _store_raw_file(source: Path, destination: str) -> None:
+    """Make ``source`` available at ``destination`` as cheaply as the filesystem allows.
+
+    A hard link moves no bytes at all; when linking is not possible (different
+    filesystem, unsupported) fall back to ``shutil.copyfile``, which uses the kernel's
+    zero-copy path where available. File metadata is not copied, nothing reads it back.
+    """
+    try:
+        os.link(source, destination)
+        return
+    except FileExistsError:
+        if os.path.samefile(source, destination):
+            return
+        os.unlink(destination)
+        try:
+            os.link(source, destination)
+            return
+        except OSError:
+            pass
+    except OSError:
+        pass
+    shutil.copyfile(source, destination)
+
+
+def _write_raw_file(destination: str, content: bytes) -> None:
+    """Write ``content`` to ``destination`` with unbuffered ``os.write`` calls.
 
+    The bytes are already in memory, so a buffered file object only adds overhead.
+    """
+    fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _email_upsert_params(parsed: ParsedEmail, raw_storage_path: Path | str) -> tuple:
+    return (
+        parsed.message_id,
+        parsed.subject,
+        parsed.sender,
+        parsed.received_at,
+        parsed.snippet,
+        str(raw_storage_path),
+    )
 
-@dataclass
+
+@dataclass(slots=True)
 class Project:
     id: int
     name: str
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     id: int
     name: Optional[str]
@@ -29,7 +184,29 @@ class Contact:
     notes: Optional[str] = None
 
 
-@dataclass
+# Column list in Contact field order, so list queries can build contacts positionally.
+_CONTACT_COLUMNS = "id, name, email, phone, notes"
+
+# get_or_create_contact() in one statement: a known contact only gains a name or phone
+# it lacks, and updated_at only moves when one of them does. DO UPDATE runs even when
+# nothing changes, so RETURNING always yields the row.
+_SQL_GET_OR_CREATE_CONTACT = f"""
+INSERT INTO contacts(name, email, phone)
+VALUES(?, ?, ?)
+ON CONFLICT(email) DO UPDATE SET
+    name = CASE WHEN COALESCE(contacts.name, '') = '' THEN COALESCE(excluded.name, contacts.name)
+        ELSE contacts.name END,
+    phone = CASE WHEN COALESCE(contacts.phone, '') = '' THEN COALESCE(excluded.phone, contacts.phone)
+        ELSE contacts.phone END,
+    updated_at = CASE
+        WHEN (COALESCE(contacts.name, '') = '' AND excluded.name IS NOT NULL)
+            OR (COALESCE(contacts.phone, '') = '' AND excluded.phone IS NOT NULL)
+        THEN datetime('now') ELSE contacts.updated_at END
+RETURNING {_CONTACT_COLUMNS}
+"""
+
+
+@dataclass(slots=True)
 class Communication:
     id: int
     type: str  # 'email', 'whatsapp', 'messenger', 'sms', 'note', 'file', 'meeting'
@@ -44,7 +221,7 @@ class Communication:
     source_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailEntry:
     id: int
     message_id: str
@@ -58,36 +235,27 @@ class EmailEntry:
     raw_path: Optional[str] = None
 
 
-def _row_to_email(row) -> EmailEntry:
-    """Convert a database row to an :class:`EmailEntry`."""
+# Column list in EmailEntry field order, so list queries can build entries positionally.
+_EMAIL_COLUMNS = (
+    "id, message_id, subject, sender, received_at, snippet, status, project_id, remind_at, raw_path"
+)
 
-    return EmailEntry(
-        id=row["id"],
-        message_id=row["message_id"],
-        subject=row["subject"],
-        sender=row["sender"],
-        received_at=row["received_at"],
-        snippet=row["snippet"],
-        status=row["status"],
-        project_id=row["project_id"],
-        remind_at=row["remind_at"],
-        raw_path=row["raw_path"] if "raw_path" in row.keys() else None,
-    )
+_SQL_UPSERT_EMAIL_RETURNING = f"{_SQL_UPSERT_EMAIL}RETURNING {_EMAIL_COLUMNS}\n"
 
 
-def _row_to_contact(row) -> Contact:
-    """Convert a database row to a :class:`Contact`."""
-    return Contact(
-        id=row["id"],
-        name=row["name"],
-        email=row["email"],
-        phone=row["phone"],
-        notes=row["notes"] if "notes" in row.keys() else None,
-    )
+def _row_columns(rows) -> frozenset[str]:
+    """Return the column names of a result set, read once from its first row.
+
+    Pass the result to the ``_row_to_*`` helpers when converting many rows so they
+    do not rebuild ``row.keys()`` for every optional-column check.
+    """
+    return frozenset(rows[0].keys()) if rows else frozenset()
 
 
-def _row_to_communication(row) -> Communication:
+def _row_to_communication(row, columns=None) -> Communication:
     """Convert a database row to a :class:`Communication`."""
+    if columns is None:
+        columns = row.keys()
     return Communication(
         id=row["id"],
         type=row["type"],
@@ -96,15 +264,22 @@ def _row_to_communication(row) -> Communication:
         timestamp=row["timestamp"],
         status=row["status"],
         remind_at=row["remind_at"],
-        raw_path=row["raw_path"] if "raw_path" in row.keys() else None,
-        content=row["content"] if "content" in row.keys() else None,
-        source_id=row["source_id"] if "source_id" in row.keys() else None,
+        raw_path=row["raw_path"] if "raw_path" in columns else None,
+        content=row["content"] if "content" in columns else None,
+        source_id=row["source_id"] if "source_id" in columns else None,
     )
 
 
+_NAME_STRIP_CHARS = string.whitespace + "\"'"
+
+
+@lru_cache(maxsize=4096)
 def extract_contact_info(sender: str | None) -> tuple[str | None, str | None]:
     """Extract name and email from sender string.
 
+    Results are memoised: the same senders recur across a mailbox, and the function
+    is pure.
+
     Examples:
         'John Doe <john@example.com>' -> ('John Doe', 'john@example.com')
         'john@example.com' -> (None, 'john@example.com')
@@ -114,36 +289,106 @@ def extract_contact_info(sender: str | None) -> tuple[str | None, str | None]:
 
     name, email = parseaddr(sender)
 
-    # Clean up name
-    if name:
-        name = name.strip().strip('"').strip("'").strip()
-        if not name:
-            name = None
+    # Clean up name: surrounding whitespace and quotes, in one pass
+    name = name.strip(_NAME_STRIP_CHARS) or None
 
     # Clean up email
-    if email:
-        email = email.strip().lower()
-        if not email:
-            email = None
+    email = email.strip().lower() or None
 
     return name, email
 
 
+def _select_emails_by_message_id(conn, message_ids: Iterable[str]) -> dict[str, EmailEntry]:
+    """Load emails keyed by Message-Id, using one ``IN (...)`` query per chunk."""
+    message_ids = list(dict.fromkeys(message_ids))
+    by_message_id = {}
+    for start in range(0, len(message_ids), _SQL_IN_CHUNK):
+        chunk = message_ids[start:start + _SQL_IN_CHUNK]
+        placeholders = ",".join("?" for _ in chunk)
+        cursor = conn.execute(
+            f"SELECT {_EMAIL_COLUMNS} FROM emails WHERE message_id IN ({placeholders})", chunk
+        )
+        by_message_id.update((entry.message_id, entry) for entry in starmap(EmailEntry, cursor))
+    return by_message_id
+
+
+# Date columns holding the email Date header, which schema version 2 stores as ISO
+# 8601 UTC.
+_DATE_COLUMNS = (("emails", "received_at"), ("communications", "timestamp"))
+
+
+def upgrade_stored_data(conn, old_version: int) -> None:
+    """Rewrite rows stored by an older schema version; see database.initialize().
+
+    Before version 2, dates were stored as the raw Date header. Known emails are never
+    re-ingested, so without this their RFC 2822 text would stay, sorting above every
+    ISO value in the listings ordered by these columns.
+    """
+    if old_version >= 2:
+        return
+    for table, column in _DATE_COLUMNS:
+        # ISO values start with the year; everything else is a candidate.
+        rows = conn.execute(
+            f"SELECT id, {column} FROM {table} "
+            f"WHERE {column} IS NOT NULL AND {column} NOT GLOB '[0-9][0-9][0-9][0-9]-*'"
+        ).fetchall()
+        conn.executemany(
+            f"UPDATE {table} SET {column} = ? WHERE id = ?",
+            [
+                (normalised, row_id)
+                for row_id, value in rows
+                if (normalised := normalise_date(value)) != value
+            ],
+        )
+
+
 class ProjectManager:
     """High level application service coordinating storage and prompts."""
 
     def __init__(self) -> None:
-        database.initialize()
+        database.initialize(upgrade_data=upgrade_stored_data)
+        # Lazily loaded copy of ignored_senders; every write goes through ignore_sender().
+        self._ignored_senders: set[str] | None = None
+        # Lazily loaded Message-Ids already in the emails table, to skip re-ingesting them.
+        self._known_message_ids: set[str] | None = None
+        # The schema does not change at runtime, so probe optional columns once.
+        self._has_project_description = self._probe_project_description()
+        # Per-thread copy of list_projects(), tagged with the connection's data_version.
+        self._projects_cache = threading.local()
+
+    @staticmethod
+    def _probe_project_description() -> bool:
+        """Return whether the projects table has a description column (older databases may not)."""
+        with database.db_session(read_only=True) as conn:
+            try:
+                conn.execute("SELECT description FROM projects LIMIT 1")
+            except sqlite3.OperationalError:
+                return False
+        return True
 
     # Project helpers ------------------------------------------------------------------
     def list_projects(self) -> list[Project]:
-        with database.db_session() as conn:
+        """Return all projects, oldest first.
+
+        The list is cached per thread. ``PRAGMA data_version`` changes whenever another
+        connection (thread or process) commits, and create_project() drops this thread's
+        copy, so a cached list is only reused while no project can have been added.
+        """
+        cache = self._projects_cache
+        with database.db_session(read_only=True) as conn:
+            (version,) = conn.execute("PRAGMA data_version").fetchone()
+            if getattr(cache, "projects", None) is not None and cache.version == version:
+                return list(cache.projects)
             rows = conn.execute("SELECT id, name FROM projects ORDER BY created_at").fetchall()
-            return [Project(id=row["id"], name=row["name"]) for row in rows]
+            projects = list(starmap(Project, rows))
+            # Inside a transaction the rows may still be rolled back; don't keep them.
+            if not conn.in_transaction:
+                cache.version, cache.projects = version, projects
+        return list(projects)
 
     def get_project(self, project_id: int) -> Optional[Project]:
         """Get a single project by ID."""
-        with database.db_session() as conn:
+        with database.db_session(read_only=True) as conn:
             row = conn.execute("SELECT id, name FROM projects WHERE id = ?", (project_id,)).fetchone()
             if row is None:
                 return None
@@ -151,13 +396,20 @@ class ProjectManager:
 
     def create_project(self, name: str, description: str = None) -> Project:
         with database.db_session() as conn:
-            cur = conn.execute(
-                "INSERT INTO projects(name, description) VALUES (?, ?)",
-                (name.strip(), description)
-            )
-            project_id = cur.lastrowid
-            row = conn.execute("SELECT id, name, description FROM projects WHERE id = ?", (project_id,)).fetchone()
-            return Project(id=row["id"], name=row["name"], description=row.get("description"))
+            params = (name.strip(), description)
+            if _SQLITE_HAS_RETURNING:
+                row = conn.execute(
+                    "INSERT INTO projects(name, description) VALUES (?, ?) RETURNING id, name, description",
+                    params,
+                ).fetchone()
+            else:
+                cur = conn.execute("INSERT INTO projects(name, description) VALUES (?, ?)", params)
+                row = conn.execute(
+                    "SELECT id, name, description FROM projects WHERE id = ?", (cur.lastrowid,)
+                ).fetchone()
+        # Commits on this thread's own connection leave data_version unchanged.
+        self._projects_cache.projects = None
+        return Project(*row)
 
     # Contact helpers ------------------------------------------------------------------
     def get_or_create_contact(self, email: str | None = None, name: str | None = None, phone: str | None = None) -> Contact:
@@ -165,70 +417,81 @@ class ProjectManager:
         if not email and not name:
             raise ValueError("Must provide at least email or name")
 
+        params = (
+            name.strip() if name else None,
+            email.lower().strip() if email else None,
+            phone.strip() if phone else None,
+        )
         with database.db_session() as conn:
+            if _SQLITE_HAS_RETURNING:
+                return Contact(*conn.execute(_SQL_GET_OR_CREATE_CONTACT, params).fetchone())
+
             # Try to find existing contact by email
             if email:
                 row = conn.execute(
-                    "SELECT * FROM contacts WHERE email = ?", (email.lower().strip(),)
+                    f"SELECT {_CONTACT_COLUMNS} FROM contacts WHERE email = ?", (params[1],)
                 ).fetchone()
 
                 if row:
                     # Update name/phone if we have better info
                     updates = []
-                    params = []
+                    update_params = []
                     if name and not row["name"]:
                         updates.append("name = ?")
-                        params.append(name.strip())
+                        update_params.append(params[0])
                     if phone and not row["phone"]:
                         updates.append("phone = ?")
-                        params.append(phone.strip())
+                        update_params.append(params[2])
 
                     if updates:
-                        params.append(row["id"])
+                        update_params.append(row["id"])
                         conn.execute(
                             f"UPDATE contacts SET {', '.join(updates)}, updated_at = datetime('now') WHERE id = ?",
-                            params
+                            update_params,
                         )
                         # Fetch updated row
-                        row = conn.execute("SELECT * FROM contacts WHERE id = ?", (row["id"],)).fetchone()
+                        row = conn.execute(
+                            f"SELECT {_CONTACT_COLUMNS} FROM contacts WHERE id = ?", (row["id"],)
+                        ).fetchone()
 
-                    return _row_to_contact(row)
+                    return Contact(*row)
 
             # Create new contact
-            cursor = conn.execute(
-                "INSERT INTO contacts(name, email, phone) VALUES (?, ?, ?)",
-                (name.strip() if name else None, email.lower().strip() if email else None, phone.strip() if phone else None)
-            )
-            row = conn.execute("SELECT * FROM contacts WHERE id = ?", (cursor.lastrowid,)).fetchone()
-            return _row_to_contact(row)
+            cursor = conn.execute("INSERT INTO contacts(name, email, phone) VALUES (?, ?, ?)", params)
+            row = conn.execute(
+                f"SELECT {_CONTACT_COLUMNS} FROM contacts WHERE id = ?", (cursor.lastrowid,)
+            ).fetchone()
+            return Contact(*row)
 
     def get_contact(self, contact_id: int) -> Optional[Contact]:
         """Get a single contact by ID."""
-        with database.db_session() as conn:
-            row = conn.execute("SELECT * FROM contacts WHERE id = ?", (contact_id,)).fetchone()
-            if row is None:
-                return None
-            return _row_to_contact(row)
+        with database.db_session(read_only=True) as conn:
+            row = conn.execute(f"SELECT {_CONTACT_COLUMNS} FROM contacts WHERE id = ?", (contact_id,)).fetchone()
+        if row is None:
+            return None
+        return Contact(*row)
 
     def list_contacts(self) -> list[Contact]:
         """List all contacts."""
-        with database.db_session() as conn:
-            rows = conn.execute("SELECT * FROM contacts ORDER BY name, email").fetchall()
-            return [_row_to_contact(row) for row in rows]
+        with database.db_session(read_only=True) as conn:
+            rows = conn.execute(
+                f"SELECT {_CONTACT_COLUMNS} FROM contacts ORDER BY name, email"
+            ).fetchall()
+        return list(starmap(Contact, rows))
 
     def get_project_contacts(self, project_id: int) -> list[Contact]:
         """Get all contacts involved in a project."""
-        with database.db_session() as conn:
+        with database.db_session(read_only=True) as conn:
             rows = conn.execute(
                 """
-                SELECT DISTINCT c.* FROM contacts c
+                SELECT c.id, c.name, c.email, c.phone, c.notes FROM contacts c
                 JOIN project_contacts pc ON c.id = pc.contact_id
                 WHERE pc.project_id = ?
                 ORDER BY c.name, c.email
                 """,
                 (project_id,)
             ).fetchall()
-            return [_row_to_contact(row) for row in rows]
+        return list(starmap(Contact, rows))
 
     # Communication helpers ------------------------------------------------------------
     def upsert_communication(
@@ -242,9 +505,7 @@ class ProjectManager:
         content: str | None = None,
     ) -> Communication:
         """Create or update a communication."""
-        with database.db_session() as conn:
-            conn.execute(
-                """
+        query = """
                 INSERT INTO communications(type, source_id, subject, snippet, timestamp, raw_path, content)
                 VALUES(?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(type, source_id) DO UPDATE SET
@@ -254,13 +515,17 @@ class ProjectManager:
                     raw_path = excluded.raw_path,
                     content = excluded.content,
                     updated_at = datetime('now')
-                """,
-                (comm_type, source_id, subject, snippet, timestamp, str(raw_path) if raw_path else None, content),
-            )
-            row = conn.execute(
-                "SELECT * FROM communications WHERE type = ? AND source_id = ?",
-                (comm_type, source_id)
-            ).fetchone()
+                """
+        params = (comm_type, source_id, subject, snippet, timestamp, str(raw_path) if raw_path else None, content)
+        with database.db_session() as conn:
+            if _SQLITE_HAS_RETURNING:
+                row = conn.execute(query + "RETURNING *", params).fetchone()
+            else:
+                conn.execute(query, params)
+                row = conn.execute(
+                    "SELECT * FROM communications WHERE type = ? AND source_id = ?",
+                    (comm_type, source_id)
+                ).fetchone()
             return _row_to_communication(row)
 
     def link_communication_to_project(self, communication_id: int, project_id: int, contact_id: int) -> None:
@@ -296,44 +561,30 @@ class ProjectManager:
 
     def get_project_communications(self, project_id: int) -> list[tuple[Communication, Contact]]:
         """Get all communications for a project with associated contacts."""
-        with database.db_session() as conn:
+        with database.db_session(read_only=True) as conn:
+            # Both tables have id/created_at/updated_at, so name the columns explicitly:
+            # Communication fields first, then Contact fields, each in field order.
             rows = conn.execute(
                 """
-                SELECT c.*, co.* FROM communications c
+                SELECT c.id, c.type, c.subject, c.snippet, c.timestamp, c.status, c.remind_at,
+                       c.raw_path, c.content, c.source_id,
+                       co.id, co.name, co.email, co.phone, co.notes
+                FROM communications c
                 JOIN project_communications pc ON c.id = pc.communication_id
                 JOIN contacts co ON pc.contact_id = co.id
                 WHERE pc.project_id = ?
-                ORDER BY datetime(c.timestamp) DESC
+                ORDER BY c.timestamp DESC
                 """,
                 (project_id,)
             ).fetchall()
 
-            result = []
-            for row in rows:
-                # Split row into communication and contact parts
-                comm = _row_to_communication(row)
-                contact = Contact(
-                    id=row["id"],  # This will be overwritten
-                    name=row["name"],
-                    email=row["email"],
-                    phone=row["phone"],
-                    notes=row.get("notes")
-                )
-                result.append((comm, contact))
-
-            return result
+        # Split each row into its communication and contact parts
+        return [(Communication(*row[:10]), Contact(*row[10:])) for row in rows]
 
     def get_contact_communications(self, contact_id: int, group_by_project: bool = True) -> dict | list:
         """Get all communications for a contact, optionally grouped by project."""
-        with database.db_session() as conn:
-            # Check if description column exists in projects table
-            has_description = False
-            try:
-                conn.execute("SELECT description FROM projects LIMIT 1")
-                has_description = True
-            except:
-                pass
-
+        with database.db_session(read_only=True) as conn:
+            has_description = self._has_project_description
             if has_description:
                 rows = conn.execute(
                     """
@@ -342,7 +593,7 @@ class ProjectManager:
                     JOIN project_communications pc ON c.id = pc.communication_id
                     JOIN projects p ON pc.project_id = p.id
                     WHERE pc.contact_id = ?
-                    ORDER BY p.name, datetime(c.timestamp) DESC
+                    ORDER BY p.name, c.timestamp DESC
                     """,
                     (contact_id,)
                 ).fetchall()
@@ -354,185 +605,248 @@ class ProjectManager:
                     JOIN project_communications pc ON c.id = pc.communication_id
                     JOIN projects p ON pc.project_id = p.id
                     WHERE pc.contact_id = ?
-                    ORDER BY p.name, datetime(c.timestamp) DESC
+                    ORDER BY p.name, c.timestamp DESC
                     """,
                     (contact_id,)
                 ).fetchall()
 
+            columns = _row_columns(rows)
             if not group_by_project:
-                return [_row_to_communication(row) for row in rows]
+                return list(map(_row_to_communication, rows, repeat(columns)))
 
-            # Group by project
+            # Group by project. Rows arrive ordered by the (unique) project name, so each
+            # project's rows are contiguous and its Project is built once per group.
+            has_description = has_description and "project_description" in columns
             grouped = {}
-            for row in rows:
-                project_id = row["project_id"]
-                if project_id not in grouped:
-                    grouped[project_id] = {
-                        "project": Project(
-                            id=row["project_id"],
-                            name=row["project_name"],
-                            description=row["project_description"] if has_description and "project_description" in row.keys() else None
-                        ),
-                        "communications": []
-                    }
-                grouped[project_id]["communications"].append(_row_to_communication(row))
+            for project_id, group in groupby(rows, key=itemgetter("project_id")):
+                first = next(group)
+                grouped[project_id] = {
+                    "project": Project(
+                        id=project_id,
+                        name=first["project_name"],
+                        description=first["project_description"] if has_description else None
+                    ),
+                    "communications": list(
+                        map(_row_to_communication, chain((first,), group), repeat(columns))
+                    ),
+                }
 
             return grouped
 
     # Sender preferences ---------------------------------------------------------------
+    def _get_ignored_senders(self) -> set[str]:
+        if self._ignored_senders is None:
+            with database.db_session(read_only=True) as conn:
+                # Rows written before senders were normalised may still carry mixed case.
+                self._ignored_senders = {
+                    _sender_key(row[0]) for row in conn.execute("SELECT email FROM ignored_senders")
+                }
+        return self._ignored_senders
+
+    def _get_known_message_ids(self) -> set[str]:
+        if self._known_message_ids is None:
+            with database.db_session(read_only=True) as conn:
+                self._known_message_ids = {
+                    row[0] for row in conn.execute("SELECT message_id FROM emails")
+                }
+        return self._known_message_ids
+
     def is_sender_ignored(self, sender: Optional[str]) -> bool:
         if not sender:
             return False
-        with database.db_session() as conn:
-            row = conn.execute(
-                "SELECT 1 FROM ignored_senders WHERE email = ?", (sender.strip(),)
-            ).fetchone()
-            return row is not None
+        return _sender_key(sender) in self._get_ignored_senders()
 
     def ignore_sender(self, sender: str) -> None:
+        sender = _sender_key(sender)
         with database.db_session() as conn:
             conn.execute(
-                "INSERT OR IGNORE INTO ignored_senders(email) VALUES (?)", (sender.strip(),)
+                "INSERT OR IGNORE INTO ignored_senders(email) VALUES (?)", (sender,)
             )
+        self._get_ignored_senders().add(sender)
 
-    # Email helpers --------------------------------------------------------------------
-    def upsert_email(self, parsed: ParsedEmail, raw_storage_path: Path) -> EmailEntry:
-        """Store email in BOTH old and new schema (dual-write for migration)."""
+    def ignore_sender_and_emails(self, sender: str, email_id: int | None = None) -> None:
+        """Ignore ``sender`` and drop their pending emails from triage in one commit.
+
+        Every unassigned or snoozed email from the sender is marked ignored, plus
+        ``email_id`` if given, whatever its status.
+        """
+        sender = _sender_key(sender)
         with database.db_session() as conn:
-            # 1. Write to OLD emails table (backward compatibility)
             conn.execute(
+                "INSERT OR IGNORE INTO ignored_senders(email) VALUES (?)", (sender,)
+            )
+            # Compare with _sender_key() in Python: SQLite's lower() folds ASCII only,
+            # so it would miss senders such as "Élodie <e@x.com>".
+            email_ids = [
+                row_id
+                for row_id, row_sender in conn.execute(
+                    "SELECT id, sender FROM emails WHERE status IN ('unassigned', 'snoozed')"
+                )
+                if row_sender and _sender_key(row_sender) == sender
+            ]
+            if email_id is not None:
+                email_ids.append(email_id)
+            conn.executemany(
                 """
-                INSERT INTO emails(message_id, subject, sender, received_at, snippet, raw_path)
-                VALUES(?, ?, ?, ?, ?, ?)
-                ON CONFLICT(message_id) DO UPDATE SET
-                    subject = excluded.subject,
-                    sender = excluded.sender,
-                    received_at = excluded.received_at,
-                    snippet = excluded.snippet,
-                    raw_path = excluded.raw_path,
-                    updated_at = datetime('now')
+                UPDATE emails
+                SET status = 'ignored', updated_at = datetime('now')
+                WHERE id = ?
                 """,
-                (
-                    parsed.message_id,
-                    parsed.subject,
-                    parsed.sender,
-                    parsed.received_at,
-                    parsed.snippet,
-                    str(raw_storage_path),
-                ),
+                [(row_id,) for row_id in email_ids],
             )
+        self._get_ignored_senders().add(sender)
+
+    # Email helpers --------------------------------------------------------------------
+    def upsert_email(self, parsed: ParsedEmail, raw_storage_path: Path | str) -> EmailEntry:
+        """Store email in BOTH old and new schema (dual-write for migration)."""
+        with database.db_session() as conn:
+            # 1. Write to OLD emails table (backward compatibility)
+            params = _email_upsert_params(parsed, raw_storage_path)
+            if _SQLITE_HAS_RETURNING:
+                row = conn.execute(_SQL_UPSERT_EMAIL_RETURNING, params).fetchone()
+            else:
+                conn.execute(_SQL_UPSERT_EMAIL, params)
+                row = conn.execute(
+                    f"SELECT {_EMAIL_COLUMNS} FROM emails WHERE message_id = ?", (parsed.message_id,)
+                ).fetchone()
 
             # 2. Write to NEW schema (communications + contacts)
-            # Extract contact info
-            name, email = extract_contact_info(parsed.sender)
+            self._upsert_communications_for_emails(conn, [(parsed, raw_storage_path)])
 
-            if email:  # Only create contact if we have an email
-                # Get or create contact
-                contact_row = conn.execute(
-                    "SELECT id FROM contacts WHERE email = ?", (email,)
-                ).fetchone()
+        if self._known_message_ids is not None:
+            self._known_message_ids.add(parsed.message_id)
 
-                if contact_row:
-                    contact_id = contact_row["id"]
-                    # Update name if we have one and it's better
-                    if name:
-                        conn.execute(
-                            """
-                            UPDATE contacts SET name = COALESCE(name, ?), updated_at = datetime('now')
-                            WHERE id = ?
-                            """,
-                            (name, contact_id)
-                        )
-                else:
-                    # Create new contact
-                    cursor = conn.execute(
-                        "INSERT INTO contacts(name, email) VALUES (?, ?)",
-                        (name, email)
-                    )
-                    contact_id = cursor.lastrowid
-
-                # Create or update communication
-                conn.execute(
-                    """
-                    INSERT INTO communications(type, source_id, subject, snippet, timestamp, raw_path)
-                    VALUES(?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(type, source_id) DO UPDATE SET
-                        subject = excluded.subject,
-                        snippet = excluded.snippet,
-                        timestamp = excluded.timestamp,
-                        raw_path = excluded.raw_path,
-                        updated_at = datetime('now')
-                    """,
-                    ("email", parsed.message_id, parsed.subject, parsed.snippet, parsed.received_at, str(raw_storage_path))
-                )
+        # Return old format for backward compatibility
+        return EmailEntry(*row)
 
-            # Return old format for backward compatibility
-            row = conn.execute(
-                "SELECT * FROM emails WHERE message_id = ?", (parsed.message_id,)
-            ).fetchone()
-            return _row_to_email(row)
+    def upsert_emails(self, batch: list[tuple[ParsedEmail, Path | str]]) -> list[EmailEntry]:
+        """Store many emails at once, sharing a single transaction.
+
+        Equivalent to calling :meth:`upsert_email` for each ``(parsed, path)`` pair,
+        but every table is written with one ``executemany`` and the results are
+        reloaded with a single query per chunk.
+        """
+        if not batch:
+            return []
+
+        with database.db_session() as conn:
+            conn.executemany(
+                _SQL_UPSERT_EMAIL,
+                [_email_upsert_params(parsed, path) for parsed, path in batch],
+            )
+            self._upsert_communications_for_emails(conn, batch)
+
+            by_message_id = _select_emails_by_message_id(
+                conn, [parsed.message_id for parsed, _ in batch]
+            )
+
+        if self._known_message_ids is not None:
+            self._known_message_ids.update(by_message_id)
+        return [by_message_id[parsed.message_id] for parsed, _ in batch]
+
+    @staticmethod
+    def _upsert_communications_for_emails(conn, batch: list[tuple[ParsedEmail, Path | str]]) -> None:
+        """Mirror emails into the contacts/communications schema, one ``executemany`` per table.
+
+        Only emails whose sender has an address are mirrored.
+        """
+        contacts = []
+        communications = []
+        for parsed, raw_storage_path in batch:
+            name, email = extract_contact_info(parsed.sender)
+            if not email:  # Only create contact if we have an email
+                continue
+            contacts.append((name, email))
+            communications.append(
+                (parsed.message_id, parsed.subject, parsed.snippet, parsed.received_at, str(raw_storage_path))
+            )
+
+        conn.executemany(_SQL_UPSERT_CONTACT, contacts)
+        conn.executemany(_SQL_UPSERT_COMMUNICATION, communications)
 
     def set_email_project(self, email_id: int, project_id: int) -> None:
         """Assign email to project. Updates BOTH old and new schema."""
+        self.set_emails_project([(email_id, project_id)])
+
+    def set_emails_project(self, assignments: Iterable[tuple[int, int]]) -> None:
+        """Assign many ``(email_id, project_id)`` pairs in one transaction."""
+        assignments = list(assignments)
         with database.db_session() as conn:
             # 1. Update OLD emails table
-            conn.execute(
+            conn.executemany(
                 """
                 UPDATE emails
                 SET project_id = ?, status = 'assigned', remind_at = NULL, updated_at = datetime('now')
                 WHERE id = ?
                 """,
-                (project_id, email_id),
+                [(project_id, email_id) for email_id, project_id in assignments],
             )
 
             # 2. Update NEW schema (if communication exists)
-            # Get the email to find its message_id and sender
-            email = conn.execute("SELECT message_id, sender FROM emails WHERE id = ?", (email_id,)).fetchone()
-            if email:
-                # Find corresponding communication
-                comm = conn.execute(
-                    "SELECT id FROM communications WHERE type = 'email' AND source_id = ?",
-                    (email["message_id"],)
-                ).fetchone()
+            self._link_emails_to_projects(conn, assignments)
 
-                if comm:
-                    # Get or create contact
-                    name, email_addr = extract_contact_info(email["sender"])
-                    if email_addr:
-                        contact = conn.execute(
-                            "SELECT id FROM contacts WHERE email = ?", (email_addr,)
-                        ).fetchone()
+    @staticmethod
+    def _link_emails_to_projects(conn, assignments: list[tuple[int, int]]) -> None:
+        """Mirror project assignments into the communications schema.
+
+        The communication behind each email is found with one join per chunk of ids;
+        the links and status updates are then written with one ``executemany`` each.
+        Emails without a communication or a known sender contact are skipped.
+        """
+        email_ids = list(dict.fromkeys(email_id for email_id, _ in assignments))
+        mirrored = {}
+        for start in range(0, len(email_ids), _SQL_IN_CHUNK):
+            chunk = email_ids[start:start + _SQL_IN_CHUNK]
+            placeholders = ",".join("?" for _ in chunk)
+            rows = conn.execute(
+                f"""
+                SELECT e.id, e.sender, c.id FROM emails e
+                JOIN communications c ON c.type = 'email' AND c.source_id = e.message_id
+                WHERE e.id IN ({placeholders})
+                """,
+                chunk,
+            ).fetchall()
+            for email_id, sender, communication_id in rows:
+                _, email_addr = extract_contact_info(sender)
+                if email_addr:
+                    mirrored[email_id] = (communication_id, email_addr)
+
+        links = [
+            (project_id, *mirrored[email_id])
+            for email_id, project_id in assignments
+            if email_id in mirrored
+        ]
+        if not links:
+            return
 
-                        if contact:
-                            # Link communication to project
-                            conn.execute(
-                                """
-                                INSERT OR IGNORE INTO project_communications(project_id, communication_id, contact_id)
-                                VALUES (?, ?, ?)
-                                """,
-                                (project_id, comm["id"], contact["id"])
-                            )
-
-                            # Update communication status
-                            conn.execute(
-                                """
-                                UPDATE communications
-                                SET status = 'assigned', remind_at = NULL, updated_at = datetime('now')
-                                WHERE id = ?
-                                """,
-                                (comm["id"],)
-                            )
-
-                            # Add to project_contacts
-                            conn.execute(
-                                """
-                                INSERT OR IGNORE INTO project_contacts(project_id, contact_id)
-                                VALUES (?, ?)
-                                """,
-                                (project_id, contact["id"])
-                            )
-
-    def set_email_snooze(self, email_id: int, remind_at: datetime) -> None:
+        # The contact is resolved by address inside each statement, so an email whose
+        # sender has no contact row writes nothing.
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO project_communications(project_id, communication_id, contact_id)
+            SELECT ?, ?, id FROM contacts WHERE email = ?
+            """,
+            links,
+        )
+        conn.executemany(
+            """
+            UPDATE communications
+            SET status = 'assigned', remind_at = NULL, updated_at = datetime('now')
+            WHERE id = ? AND EXISTS (SELECT 1 FROM contacts WHERE email = ?)
+            """,
+            [(communication_id, email_addr) for _, communication_id, email_addr in links],
+        )
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO project_contacts(project_id, contact_id)
+            SELECT ?, id FROM contacts WHERE email = ?
+            """,
+            [(project_id, email_addr) for project_id, _, email_addr in links],
+        )
+
+    def set_email_snooze(self, email_id: int, remind_at: datetime) -> str:
+        """Snooze an email until ``remind_at`` and return the timestamp as stored."""
+        stored = _utc_timestamp(remind_at)
         with database.db_session() as conn:
             conn.execute(
                 """
@@ -540,88 +854,125 @@ class ProjectManager:
                 SET status = 'snoozed', remind_at = ?, updated_at = datetime('now')
                 WHERE id = ?
                 """,
-                (remind_at.isoformat(timespec="seconds"), email_id),
+                (stored, email_id),
             )
+        return stored
 
     def set_email_ignored(self, email_id: int) -> None:
+        self.set_emails_ignored([email_id])
+
+    def set_emails_ignored(self, email_ids: Iterable[int]) -> None:
+        """Mark many emails as ignored in one transaction."""
+        email_ids = list(email_ids)
         with database.db_session() as conn:
-            conn.execute(
-                """
-                UPDATE emails
-                SET status = 'ignored', updated_at = datetime('now')
-                WHERE id = ?
-                """,
-                (email_id,),
-            )
+            for start in range(0, len(email_ids), _SQL_IN_CHUNK):
+                chunk = email_ids[start:start + _SQL_IN_CHUNK]
+                placeholders = ",".join("?" for _ in chunk)
+                conn.execute(
+                    f"""
+                    UPDATE emails
+                    SET status = 'ignored', updated_at = datetime('now')
+                    WHERE id IN ({placeholders})
+                    """,
+                    chunk,
+                )
 
     def get_email(self, email_id: int) -> Optional[EmailEntry]:
-        with database.db_session() as conn:
-            row = conn.execute("SELECT * FROM emails WHERE id = ?", (email_id,)).fetchone()
+        with database.db_session(read_only=True) as conn:
+            row = conn.execute(f"SELECT {_EMAIL_COLUMNS} FROM emails WHERE id = ?", (email_id,)).fetchone()
         if row is None:
             return None
-        return _row_to_email(row)
+        return EmailEntry(*row)
 
-    def list_pending_reminders(self) -> list[EmailEntry]:
-        with database.db_session() as conn:
-            rows = conn.execute(
-                """
-SELECT * FROM emails
+    def iter_pending_reminders(self) -> Iterator[EmailEntry]:
+        """Yield snoozed emails whose reminder is due, streaming rows from the cursor.
+
+        The query is read-only, so it runs on the shared connection without opening a
+        session; rows are only materialised as the caller consumes them.
+        """
+        # remind_at is written by _utc_timestamp(), which sorts chronologically as
+        # text; comparing the bare column lets idx_emails_snoozed serve both the
+        # filter and the ORDER BY.
+        cursor = database.get_shared_connection().execute(
+            f"""
+SELECT {_EMAIL_COLUMNS} FROM emails
 WHERE status = 'snoozed'
-  AND remind_at IS NOT NULL
-  AND datetime(remind_at) <= datetime('now')
-ORDER BY datetime(remind_at)
-                """
-            ).fetchall()
-        return [_row_to_email(row) for row in rows]
+  AND remind_at <= {_SQL_UTC_NOW}
+ORDER BY remind_at
+            """
+        )
+        return starmap(EmailEntry, cursor)
+
+    def list_pending_reminders(self) -> list[EmailEntry]:
+        return list(self.iter_pending_reminders())
+
+    def next_reminder_at(self, after: datetime | None = None) -> Optional[datetime]:
+        """Return when the earliest snoozed email (due after ``after``, if given) is due."""
+        query = "SELECT MIN(remind_at) FROM emails WHERE status = 'snoozed'"
+        params: tuple = ()
+        if after is not None:
+            query += " AND remind_at > ?"
+            params = (_utc_timestamp(after),)
+        with database.db_session(read_only=True) as conn:
+            (remind_at,) = conn.execute(query, params).fetchone()
+        if not remind_at:
+            return None
+        due = datetime.fromisoformat(remind_at)
+        # Values written before _utc_timestamp() may lack an offset; they are UTC.
+        return due if due.tzinfo is not None else due.replace(tzinfo=UTC)
 
     def get_emails_by_project(self, project_id: int) -> list[EmailEntry]:
         """Get all emails assigned to a specific project."""
-        with database.db_session() as conn:
+        with database.db_session(read_only=True) as conn:
             rows = conn.execute(
-                """
-SELECT * FROM emails
+                f"""
+SELECT {_EMAIL_COLUMNS} FROM emails
 WHERE project_id = ?
-ORDER BY datetime(received_at) DESC
+ORDER BY received_at DESC
                 """,
                 (project_id,)
             ).fetchall()
-        return [_row_to_email(row) for row in rows]
+        return list(starmap(EmailEntry, rows))
 
     def get_email_content(self, email_id: int) -> Optional[tuple[str, str]]:
         """Get the full content of an email from its raw file.
 
         Returns a tuple of (content, content_type) where content_type is 'text' or 'html'.
         """
-        from email import policy
-        from email.parser import BytesParser
-        from email.message import EmailMessage
-
         email = self.get_email(email_id)
         if email is None or email.raw_path is None:
             return None
 
-        raw_path = Path(email.raw_path)
-        if not raw_path.exists():
+        try:
+            # A missing file surfaces as OSError from open(); no separate exists() check.
+            with open(email.raw_path, "rb") as fp:
+                message: EmailMessage = _EMAIL_PARSER.parse(fp)
+        except OSError:
             return None
 
         try:
-            with raw_path.open("rb") as fp:
-                message: EmailMessage = BytesParser(policy=policy.default).parse(fp)
-
             # Try to get HTML content first (richer format)
             html_parts = []
             text_parts = []
 
             if message.is_multipart():
+                # Plain-text parts are only decoded when the message has no HTML.
+                plain_parts = []
                 for part in message.walk():
                     content_type = part.get_content_type()
-                    try:
-                        if content_type == "text/html":
+                    if content_type == "text/html":
+                        try:
                             html_parts.append(part.get_content())
-                        elif content_type == "text/plain":
+                        except Exception:
+                            continue
+                    elif content_type == "text/plain" and not html_parts:
+                        plain_parts.append(part)
+                if not html_parts:
+                    for part in plain_parts:
+                        try:
                             text_parts.append(part.get_content())
-                    except Exception:
-                        continue
+                        except Exception:
+                            continue
             else:
                 content_type = message.get_content_type()
                 try:
@@ -645,62 +996,144 @@ ORDER BY datetime(received_at) DESC
 
     # High level flow ------------------------------------------------------------------
     def ingest_email_file(self, path: Path) -> Optional[EmailEntry]:
-        parsed = parse_email_file(path)
-        if self.is_sender_ignored(parsed.sender):
-            return None
+        return self.ingest_email_files([path])[0]
 
-        safe_stem = "".join(
-            ch if ch.isalnum() or ch in {"-", "_"} else "_" for ch in parsed.message_id
-        )
-        storage_path = RAW_EMAIL_DIR / f"{safe_stem}.eml"
-        shutil.copy2(path, storage_path)
+    def ingest_email_files(self, paths: Iterable[Path]) -> list[Optional[EmailEntry]]:
+        """Ingest several .eml files, writing all of them in one transaction.
 
-        return self.upsert_email(parsed, storage_path)
+        Returns one entry per path, in order; ``None`` marks emails from ignored senders.
+        Emails whose Message-Id is already stored are returned as-is without rewriting
+        their raw copy or row.
+        """
+        known = self._get_known_message_ids()
+
+        # Parse and copy outside the write transaction; only the upserts need the lock.
+        message_ids: list[Optional[str]] = []
+        batch: list[tuple[ParsedEmail, str]] = []
+        batched: set[str] = set()
+        for path in paths:
+            parsed = parse_email_file(path)
+            if self.is_sender_ignored(parsed.sender):
+                message_ids.append(None)
+                continue
 
-    def ingest_from_source(self, raw_email) -> Optional[EmailEntry]:
-        """Ingest an email from an email source (Gmail)."""
-        # Import here to avoid circular dependency
-        from .email_sources import RawEmail
+            message_ids.append(parsed.message_id)
+            if parsed.message_id in known or parsed.message_id in batched:
+                continue
 
-        if self.is_sender_ignored(raw_email.sender):
-            return None
+            storage_path = _raw_storage_path(parsed.message_id)
+            _store_raw_file(path, storage_path)
+            batch.append((parsed, storage_path))
+            batched.add(parsed.message_id)
 
-        # Create safe filename from message_id
-        safe_stem = "".join(
-            ch if ch.isalnum() or ch in {"-", "_"} else "_" for ch in raw_email.message_id
-        )
-        storage_path = RAW_EMAIL_DIR / f"{safe_stem}.eml"
+        entries = {entry.message_id: entry for entry in self.upsert_emails(batch)}
+        existing = [mid for mid in message_ids if mid is not None and mid not in entries]
+        if existing:
+            with database.db_session(read_only=True) as conn:
+                entries.update(_select_emails_by_message_id(conn, existing))
+        return [None if mid is None else entries[mid] for mid in message_ids]
+
+    def ingest_from_source(self, raw_email, source=None) -> Optional[EmailEntry]:
+        """Ingest an email from an email source (Gmail).
 
-        # Save raw email content to storage
-        storage_path.write_bytes(raw_email.raw_content)
+        Pass the ``source`` the email came from if it may be header-only.
+        """
+        return self.ingest_raw_emails([raw_email], source)[0]
 
-        # Parse to our internal format
-        parsed = parse_raw_email(raw_email, storage_path)
+    def ingest_raw_emails(
+        self, raw_emails: Iterable, source=None
+    ) -> list[Optional[EmailEntry]]:
+        """Ingest emails fetched from an email source, storing new ones in one transaction.
 
-        return self.upsert_email(parsed, storage_path)
+        When ``source`` is given, its fetch_bodies() is called for the new emails only,
+        so sources that list headers first never download emails already stored or
+        from ignored senders; emails it cannot fetch are skipped. Without a source,
+        new emails lacking raw content raise ValueError before anything is written.
+
+        Returns one entry per input, in order: ``None`` for ignored senders and skipped
+        emails, the stored entry otherwise.
+        """
+        known = self._get_known_message_ids()
+
+        message_ids: list[Optional[str]] = []
+        pending = []
+        batched: set[str] = set()
+        for raw_email in raw_emails:
+            if self.is_sender_ignored(raw_email.sender):
+                message_ids.append(None)
+                continue
+
+            message_ids.append(raw_email.message_id)
+            # Unread emails are fetched again until marked as processed; skip the rewrite.
+            if raw_email.message_id in known or raw_email.message_id in batched:
+                continue
+            pending.append(raw_email)
+            batched.add(raw_email.message_id)
+
+        if source is not None:
+            source.fetch_bodies(pending)
+            # The source could not fetch these (e.g. deleted since they were listed).
+            vanished = {
+                raw_email.message_id for raw_email in pending if raw_email.raw_content is None
+            }
+            if vanished:
+                pending = [
+                    raw_email for raw_email in pending if raw_email.message_id not in vanished
+                ]
+                message_ids = [None if mid in vanished else mid for mid in message_ids]
+        missing = [raw_email.message_id for raw_email in pending if raw_email.raw_content is None]
+        if missing:
+            raise ValueError(
+                f"No raw content for {', '.join(missing)}; pass the source to fetch bodies"
+            )
+
+        batch: list[tuple[ParsedEmail, str]] = []
+        for raw_email in pending:
+            # Save raw email content to storage
+            storage_path = _raw_storage_path(raw_email.message_id)
+            _write_raw_file(storage_path, raw_email.raw_content)
+
+            batch.append((parse_raw_email(raw_email, Path(storage_path)), storage_path))
+
+        entries = {entry.message_id: entry for entry in self.upsert_emails(batch)}
+        existing = [mid for mid in message_ids if mid is not None and mid not in entries]
+        if existing:
+            with database.db_session(read_only=True) as conn:
+                entries.update(_select_emails_by_message_id(conn, existing))
+        return [None if mid is None else entries[mid] for mid in message_ids]
 
     def fetch_from_all_sources(self, max_per_source: int = 10) -> list[EmailEntry]:
-        """Fetch emails from all configured email sources."""
+        """Fetch emails from all configured email sources.
+
+        Sources are fetched concurrently, since each fetch is mostly waiting on the
+        network; each source's emails are ingested on this thread as soon as its fetch
+        completes, so database writes stay serialised.
+        """
         from .email_sources import get_available_sources
 
         sources = get_available_sources()
         ingested_emails = []
+        if not sources:
+            return ingested_emails
+
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = {
+                executor.submit(source.fetch_unread, max_results=max_per_source): source
+                for source in sources
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    raw_emails = future.result()
+                    print(f"Fetched {len(raw_emails)} emails from {source.__class__.__name__}")
 
-        for source in sources:
-            try:
-                raw_emails = source.fetch_unread(max_results=max_per_source)
-                print(f"Fetched {len(raw_emails)} emails from {source.__class__.__name__}")
-
-                for raw_email in raw_emails:
-                    email_entry = self.ingest_from_source(raw_email)
-                    if email_entry:
-                        ingested_emails.append(email_entry)
-                        # Optionally mark as processed in the source
-                        # source.mark_as_processed(raw_email.source_id)
-
-            except Exception as e:
-                print(f"Error fetching from {source.__class__.__name__}: {e}")
-                continue
+                    for email_entry in self.ingest_raw_emails(raw_emails, source):
+                        if email_entry:
+                            ingested_emails.append(email_entry)
+
+                except Exception as e:
+                    print(f"Error fetching from {source.__class__.__name__}: {e}")
+                    continue
 
         return ingested_emails
 
@@ -711,17 +1144,30 @@ REMINDER_OFFSETS = {
     "3": ("in 1 month", timedelta(days=30)),
 }
 
+_SNOOZE_MENU = "\n".join(
+    f"  [{key}] Remind me {label}" for key, (label, _) in REMINDER_OFFSETS.items()
+)
+
+
+def prompt_user_for_email(
+    manager: ProjectManager,
+    email: EmailEntry,
+    projects: list[Project] | None = None,
+) -> None:
+    """Interactive prompt for categorising an email.
 
-def prompt_user_for_email(manager: ProjectManager, email: EmailEntry) -> None:
-    """Interactive prompt for categorising an email."""
+    Callers triaging several emails can fetch ``projects`` once and pass the same list
+    to every prompt; projects created during the prompt are appended to it.
+    """
     print("\nNew email detected:")
     print(f"From: {email.sender or 'Unknown'}")
     print(f"Subject: {email.subject or '(no subject)'}")
-    print(f"Received: {email.received_at or 'Unknown'}")
+    print(f"Received: {display_date(email.received_at) or 'Unknown'}")
     if email.snippet:
         print(f"Snippet: {email.snippet}")
 
-    projects = manager.list_projects()
+    if projects is None:
+        projects = manager.list_projects()
     if projects:
         print("\nAssign to an existing project:")
         for index, project in enumerate(projects, start=1):
@@ -729,66 +1175,121 @@ def prompt_user_for_email(manager: ProjectManager, email: EmailEntry) -> None:
     else:
         print("\nNo projects yet. You can create a new one.")
 
+    def assign_to(project: Project) -> bool:
+        manager.set_email_project(email.id, project.id)
+        print(f"Assigned to project: {project.name}")
+        return True
+
+    def create_and_assign() -> bool:
+        name = input("New project name: ").strip()
+        if not name:
+            print("Project name cannot be empty.")
+            return False
+        # One commit for both writes: a failed assignment leaves no orphan project.
+        with database.db_session():
+            project = manager.create_project(name)
+            manager.set_email_project(email.id, project.id)
+        projects.append(project)
+        print(f"Created and assigned to project: {project.name}")
+        return True
+
+    def snooze() -> bool:
+        _handle_snooze(manager, email)
+        return True
+
+    def ignore() -> bool:
+        if email.sender:
+            manager.ignore_sender_and_emails(email.sender, email.id)
+        else:
+            manager.set_email_ignored(email.id)
+        print("Sender ignored for future emails.")
+        return True
+
+    # Menu number -> action; an action returns False to show the prompt again.
+    actions = {
+        index: partial(assign_to, project) for index, project in enumerate(projects, start=1)
+    }
     extra_offset = len(projects)
-    create_option = extra_offset + 1
-    snooze_option = extra_offset + 2
-    ignore_option = extra_offset + 3
+    actions[extra_offset + 1] = create_and_assign
+    actions[extra_offset + 2] = snooze
+    actions[extra_offset + 3] = ignore
 
-    print(f"  [{create_option}] Create a new project")
-    print(f"  [{snooze_option}] Decide later (snooze)")
-    print(f"  [{ignore_option}] Never ask for emails from this sender")
+    print(f"  [{extra_offset + 1}] Create a new project")
+    print(f"  [{extra_offset + 2}] Decide later (snooze)")
+    print(f"  [{extra_offset + 3}] Never ask for emails from this sender")
 
     while True:
         choice = input("Select an option: ").strip()
-        if choice.isdigit():
-            number = int(choice)
-            if 1 <= number <= len(projects):
-                selected_project = projects[number - 1]
-                manager.set_email_project(email.id, selected_project.id)
-                print(f"Assigned to project: {selected_project.name}")
-                return
-            if number == create_option:
-                name = input("New project name: ").strip()
-                if not name:
-                    print("Project name cannot be empty.")
-                    continue
-                project = manager.create_project(name)
-                manager.set_email_project(email.id, project.id)
-                print(f"Created and assigned to project: {project.name}")
-                return
-            if number == snooze_option:
-                _handle_snooze(manager, email)
-                return
-            if number == ignore_option:
-                if email.sender:
-                    manager.ignore_sender(email.sender)
-                manager.set_email_ignored(email.id)
-                print("Sender ignored for future emails.")
-                return
-        print("Invalid choice. Please select a listed option.")
+        action = actions.get(int(choice)) if choice.isdigit() else None
+        if action is None:
+            print("Invalid choice. Please select a listed option.")
+            continue
+        if action():
+            return
 
 
 def _handle_snooze(manager: ProjectManager, email: EmailEntry) -> None:
     print("\nSnooze options:")
-    for key, (label, _) in REMINDER_OFFSETS.items():
-        print(f"  [{key}] Remind me {label}")
+    print(_SNOOZE_MENU)
     while True:
         choice = input("Select reminder interval: ").strip()
-        if choice in REMINDER_OFFSETS:
-            label, delta = REMINDER_OFFSETS[choice]
-            remind_at = datetime.now(UTC) + delta
-
-            manager.set_email_snooze(email.id, remind_at)
-            print(f"Email snoozed until {remind_at.isoformat(timespec='seconds')} ({label}).")
-            return
-        print("Invalid choice. Try again.")
-
-
-def iter_pending_emails(manager: ProjectManager, statuses: Iterable[str] = ("unassigned", "snoozed")) -> list[EmailEntry]:
-    placeholders = ",".join("?" for _ in statuses)
-    query = (
-        "SELECT * FROM emails WHERE status IN (%s) ORDER BY updated_at" % placeholders
-    )
-    with database.db_session() as conn:
-        rows = conn.execute(query, tuple(statuses)).fetchall()
-    return [_row_to_email(row) for row in rows]
+        offset = REMINDER_OFFSETS.get(choice)
+        if offset is None:
+            print("Invalid choice. Try again.")
+            continue
+        label, delta = offset
+        remind_at = datetime.now(UTC) + delta
+
+        stored = manager.set_email_snooze(email.id, remind_at)
+        print(f"Email snoozed until {stored} ({label}).")
+        return
+
+
+def watch_reminders(
+    manager: ProjectManager,
+    on_due: Callable[[EmailEntry], None],
+    stop: threading.Event | None = None,
+    min_interval: float = 30.0,
+    max_interval: float = 3600.0,
+) -> None:
+    """Call ``on_due`` once for each reminder as it becomes due, until ``stop`` is set.
+
+    Rather than polling at a fixed rate, the watcher asks for the next ``remind_at`` and
+    sleeps until then, clamped to ``[min_interval, max_interval]`` so snoozes created
+    elsewhere are still noticed. Can run in a background thread.
+    """
+    stop = stop or threading.Event()
+    # Keyed by remind_at too, so an email snoozed again is reported when next due;
+    # only reminders still due are kept, so the set does not grow with the session.
+    reported: set[tuple[int, str | None]] = set()
+    while not stop.is_set():
+        now = datetime.now(UTC)
+        due = set()
+        for entry in manager.iter_pending_reminders():
+            key = (entry.id, entry.remind_at)
+            due.add(key)
+            if key not in reported:
+                on_due(entry)
+        reported = due
+
+        next_due = manager.next_reminder_at(after=now)
+        delay = max_interval if next_due is None else (next_due - now).total_seconds()
+        stop.wait(min(max(delay, min_interval), max_interval))
+
+
+@lru_cache(maxsize=8)
+def _pending_emails_sql(status_count: int) -> str:
+    """Build the iter_pending_emails query for ``status_count`` statuses, once per arity."""
+    placeholders = ",".join("?" * status_count)
+    return f"SELECT {_EMAIL_COLUMNS} FROM emails WHERE status IN ({placeholders}) ORDER BY updated_at"
+
+
+def iter_pending_emails(manager: ProjectManager, statuses: Iterable[str] = ("unassigned", "snoozed")) -> Iterator[EmailEntry]:
+    """Yield emails with one of ``statuses``, least recently updated first.
+
+    Like :meth:`ProjectManager.iter_pending_reminders`, rows stream from a cursor on
+    the shared connection as the caller consumes them.
+    """
+    statuses = tuple(statuses)
+    cursor = database.get_shared_connection().execute(_pending_emails_sql(len(statuses)), statuses)
+    return starmap(EmailEntry, cursor)
@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 import argparse
+from itertools import chain
 from pathlib import Path
 from typing import Iterable
 
 from .app import (
+    EmailEntry,
     ProjectManager,
     iter_pending_emails,
     prompt_user_for_email,
+    watch_reminders,
 )
 
 
@@ -45,6 +48,10 @@ def build_parser() -> argparse.ArgumentParser:
 
     subparsers.add_parser("check-reminders", help="Show emails whose snooze expired")
 
+    subparsers.add_parser(
+        "watch-reminders", help="Keep running and report snoozed emails as they come due"
+    )
+
     return parser
 
 
@@ -63,33 +70,50 @@ def handle_list_emails(manager: ProjectManager, statuses: Iterable[str] | None)
     else:
         entries = iter_pending_emails(manager, ("unassigned", "snoozed", "assigned", "ignored"))
 
-    if not entries:
+    first = next(entries, None)
+    if first is None:
         print("No emails tracked with the selected filters.")
         return
 
-    for entry in entries:
+    for entry in chain((first,), entries):
         project_label = str(entry.project_id) if entry.project_id else "(unassigned)"
         print(
             f"[{entry.id}] status={entry.status} project={project_label} subject={entry.subject or '(no subject)'}"
         )
 
 
+def print_reminder(entry: EmailEntry) -> None:
+    print(
+        f"Reminder ready: email {entry.id} from {entry.sender or 'Unknown'} "
+        f"subject {entry.subject or '(no subject)'}"
+    )
+
+
 def handle_check_reminders(manager: ProjectManager) -> None:
-    reminders = manager.list_pending_reminders()
-    if not reminders:
+    reminders = manager.iter_pending_reminders()
+    first = next(reminders, None)
+    if first is None:
         print("No reminders due right now.")
         return
-    for entry in reminders:
-        print(
-            f"Reminder ready: email {entry.id} from {entry.sender or 'Unknown'} "
-            f"subject {entry.subject or '(no subject)'}"
-        )
+    for entry in chain((first,), reminders):
+        print_reminder(entry)
+
+
+def handle_watch_reminders(manager: ProjectManager) -> None:
+    print("Watching for due reminders (Ctrl+C to stop)...")
+    try:
+        watch_reminders(manager, print_reminder)
+    except KeyboardInterrupt:
+        print()
 
 
 def handle_setup_gmail() -> None:
     """Setup Gmail OAuth authentication."""
+    from .config import ensure_directories
     from .email_sources import GmailSource, GMAIL_CREDENTIALS_PATH
 
+    # The credentials file is saved into the app home, so make sure it exists.
+    ensure_directories()
     if not GMAIL_CREDENTIALS_PATH.exists():
         print(f"\nGmail OAuth credentials not found at: {GMAIL_CREDENTIALS_PATH}")
         print("\nTo setup Gmail integration:")
@@ -142,8 +166,9 @@ def handle_fetch(manager: ProjectManager, max_results: int, auto_triage: bool) -
 
     if auto_triage:
         print("\nStarting auto-triage...")
+        projects = manager.list_projects()
         for email_entry in ingested:
-            prompt_user_for_email(manager, email_entry)
+            prompt_user_for_email(manager, email_entry, projects)
     else:
         print("\nUse 'list-emails --status unassigned' to see them.")
         print("Or run 'fetch --auto-triage' to triage immediately.")
@@ -175,6 +200,8 @@ def main(args: list[str] | None = None) -> None:
         handle_list_emails(manager, parsed.status)
     elif parsed.command == "check-reminders":
         handle_check_reminders(manager)
+    elif parsed.command == "watch-reminders":
+        handle_watch_reminders(manager)
     else:
         parser.print_help()
 
@@ -23,6 +23,8 @@ def ensure_directories() -> Path:
     return home
 
 
-HOME_DIR = ensure_directories()
+# Resolved at import, created on first use (database.get_connection() calls
+# ensure_directories()), so importing the package does not touch the filesystem.
+HOME_DIR = get_home()
 DB_PATH = HOME_DIR / "project_manager.db"
 RAW_EMAIL_DIR = HOME_DIR / "raw_emails"
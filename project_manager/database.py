@@ -1,12 +1,17 @@
 """SQLite storage helpers for the personal project manager app."""
 from __future__ import annotations
 
+import atexit
 import sqlite3
+import threading
 from contextlib import contextmanager
-from typing import Iterator
+from typing import Callable, Iterator
 
 from .config import DB_PATH, ensure_directories
 
+# Bump whenever SCHEMA changes, so existing databases pick up the new DDL.
+SCHEMA_VERSION = 2
+
 SCHEMA = """
 -- Projects remain largely the same
 CREATE TABLE IF NOT EXISTS projects (
@@ -100,31 +105,132 @@ CREATE INDEX IF NOT EXISTS idx_communications_timestamp ON communications(timest
 CREATE INDEX IF NOT EXISTS idx_project_communications_project ON project_communications(project_id);
 CREATE INDEX IF NOT EXISTS idx_project_communications_contact ON project_communications(contact_id);
 CREATE INDEX IF NOT EXISTS idx_contacts_email ON contacts(email);
+CREATE INDEX IF NOT EXISTS idx_emails_project_received ON emails(project_id, received_at);
+CREATE INDEX IF NOT EXISTS idx_emails_status_updated ON emails(status, updated_at);
+-- Partial index: only snoozed rows, ordered by when they are due. status leads the key
+-- so the planner prefers it over idx_emails_status_updated for reminder checks.
+CREATE INDEX IF NOT EXISTS idx_emails_snoozed ON emails(status, remind_at) WHERE status = 'snoozed';
 """
 
 
+# Settings applied once to each long-lived connection. With the WAL journal (enabled
+# in initialize()), synchronous=NORMAL costs one fsync per commit and stays crash-safe.
+SESSION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA cache_size = -65536;",  # 64 MiB page cache
+    "PRAGMA mmap_size = 268435456;",  # 256 MiB memory-mapped reads
+)
+
+STATEMENT_CACHE_SIZE = 512
+
+_local = threading.local()
+
+
 def get_connection() -> sqlite3.Connection:
     """Create a SQLite connection with sensible defaults."""
     ensure_directories()
-    conn = sqlite3.connect(DB_PATH)
+    # The shared connection sees every statement the app issues, plus one variant per
+    # IN (...) chunk size; keep them all prepared rather than the default 128.
+    conn = sqlite3.connect(DB_PATH, cached_statements=STATEMENT_CACHE_SIZE)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON;")
     return conn
 
 
-def initialize() -> None:
-    """Ensure the database schema is present."""
-    with get_connection() as conn:
-        conn.executescript(SCHEMA)
-        conn.commit()
+def get_shared_connection() -> sqlite3.Connection:
+    """Return this thread's long-lived connection, opening it on first use.
+
+    Reusing one connection per thread avoids reopening the database file and keeps
+    sqlite3's prepared-statement cache warm between calls. The connection runs in
+    autocommit mode; db_session() opens and ends write transactions explicitly.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = get_connection()
+        conn.isolation_level = None
+        for pragma in SESSION_PRAGMAS:
+            conn.execute(pragma)
+        _local.conn = conn
+        _local.depth = 0
+    return conn
+
+
+def close_shared_connection() -> None:
+    """Close this thread's shared connection, if it has one.
+
+    Runs for the main thread at interpreter exit; closing the last connection lets
+    SQLite checkpoint the WAL back into the database file.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        del _local.conn
+        conn.close()
+
+
+atexit.register(close_shared_connection)
+
+
+def initialize(
+    upgrade_data: Callable[[sqlite3.Connection, int], None] | None = None,
+) -> None:
+    """Ensure the database schema is present.
+
+    The schema script only runs when the file's ``user_version`` is older than
+    SCHEMA_VERSION, so a normal start costs one pragma read instead of re-parsing
+    every ``CREATE ... IF NOT EXISTS``. ``upgrade_data(conn, old_version)`` then
+    rewrites rows stored by older versions, in the same transaction that records the
+    new version.
+    """
+    conn = get_shared_connection()
+    (version,) = conn.execute("PRAGMA user_version;").fetchone()
+    if version >= SCHEMA_VERSION:
+        return
+    # journal_mode is stored in the database file, so setting it once is enough;
+    # WAL lets readers proceed while a write is in flight.
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.executescript(SCHEMA)
+    with db_session() as session:
+        if upgrade_data is not None:
+            upgrade_data(session, version)
+        session.execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
 
 
 @contextmanager
-def db_session() -> Iterator[sqlite3.Connection]:
-    """Context manager yielding a database connection."""
-    conn = get_connection()
+def db_session(read_only: bool = False) -> Iterator[sqlite3.Connection]:
+    """Context manager yielding this thread's shared database connection.
+
+    The outermost session runs in a ``BEGIN IMMEDIATE`` transaction, committed on
+    success and rolled back on error. Taking the write lock up front means a session
+    that reads before it writes cannot fail with ``SQLITE_BUSY`` halfway through when
+    another thread commits first; it waits for the lock instead. Nested sessions run
+    inside a savepoint, so their work only becomes durable with the outer commit.
+
+    ``read_only`` sessions skip all of that: each SELECT already reads a consistent
+    snapshot, and writes from an enclosing session are visible on the same connection.
+    """
+    conn = get_shared_connection()
+    if read_only:
+        yield conn
+        return
+
+    depth = _local.depth
+    savepoint = f"db_session_{depth}"
+    conn.execute(f"SAVEPOINT {savepoint}" if depth else "BEGIN IMMEDIATE")
+    _local.depth = depth + 1
     try:
         yield conn
-        conn.commit()
+    except BaseException:
+        if depth:
+            conn.execute(f"ROLLBACK TO {savepoint}")
+            conn.execute(f"RELEASE {savepoint}")
+        elif conn.in_transaction:  # SQLite may already have rolled back on error
+            conn.execute("ROLLBACK")
+        raise
+    else:
+        if depth:
+            conn.execute(f"RELEASE {savepoint}")
+        else:
+            conn.execute("COMMIT")
     finally:
-        conn.close()
+        _local.depth = depth
@@ -1,36 +1,47 @@
 """Email source abstraction for fetching emails from Gmail."""
 from __future__ import annotations
 
-import base64
+import os
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from email import policy
-from email.message import EmailMessage
-from email.parser import BytesParser
-from typing import Optional
+from typing import Iterator, Optional
 
 from .config import HOME_DIR
+from .email_utils import extract_plain_text
+
+# pybase64 decodes with SIMD; Gmail raw payloads (attachments included) can be
+# megabytes of base64. The standard library module has the same API.
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
 
 # Gmail API imports (optional dependencies)
 try:
+    import httplib2
     from google.auth.transport.requests import Request
     from google.oauth2.credentials import Credentials
+    from google_auth_httplib2 import AuthorizedHttp
     from google_auth_oauthlib.flow import InstalledAppFlow
     from googleapiclient.discovery import build
+    from googleapiclient.errors import HttpError
     GMAIL_AVAILABLE = True
 except ImportError:
     GMAIL_AVAILABLE = False
 
 
-@dataclass
+@dataclass(slots=True)
 class RawEmail:
     """Represents a raw email fetched from an email source."""
     message_id: str
     sender: Optional[str]
     subject: Optional[str]
     received_at: Optional[str]
-    body_text: str
-    raw_content: bytes  # raw RFC822 email content
+    # Sources may fetch headers only; EmailSource.fetch_bodies() fills these in.
+    body_text: Optional[str]
+    raw_content: Optional[bytes]  # raw RFC822 email content
     source_id: str  # provider-specific ID (for marking as read, etc.)
     source_type: str  # 'gmail'
 
@@ -43,6 +54,12 @@ class EmailSource(ABC):
         """Fetch unread emails from the source."""
         pass
 
+    def fetch_bodies(self, raw_emails: list[RawEmail]) -> None:
+        """Fill in body_text and raw_content for emails fetched without them.
+
+        Sources whose fetch_unread() returns complete emails need not override this.
+        """
+
     @abstractmethod
     def mark_as_processed(self, source_id: str) -> None:
         """Mark an email as processed in the source (e.g., add label, mark read)."""
@@ -61,6 +78,24 @@ class EmailSource(ABC):
 GMAIL_SCOPES = ['https://www.googleapis.com/auth/gmail.modify']
 GMAIL_TOKEN_PATH = HOME_DIR / 'gmail_token.json'
 GMAIL_CREDENTIALS_PATH = HOME_DIR / 'gmail_credentials.json'
+# Gmail accepts up to 100 calls per batch but recommends at most 50 to stay clear of
+# rate limiting.
+GMAIL_BATCH_SIZE = 50
+# Concurrent single requests used when the batch endpoint rejects a batch.
+GMAIL_FALLBACK_WORKERS = 8
+# Headers requested when listing; the full message is only fetched for new emails.
+GMAIL_METADATA_HEADERS = ['From', 'Subject', 'Date', 'Message-Id']
+
+# Serialises token loads, refreshes and saves across GmailSource instances and
+# threads, so a token is refreshed once rather than by every caller that saw it expire.
+_token_lock = threading.Lock()
+
+
+def _save_token(creds) -> None:
+    """Write ``creds`` to the token file atomically, via a temporary file."""
+    tmp_path = GMAIL_TOKEN_PATH.with_name(GMAIL_TOKEN_PATH.name + '.tmp')
+    tmp_path.write_text(creds.to_json())
+    os.replace(tmp_path, GMAIL_TOKEN_PATH)
 
 
 class GmailSource(EmailSource):
@@ -74,6 +109,10 @@ class GmailSource(EmailSource):
                 "google-auth-httplib2 google-api-python-client"
             )
         self.service = None
+        self._creds = None
+        # httplib2 is not thread-safe: concurrent fallback requests get one
+        # authorised Http per worker thread.
+        self._local = threading.local()
 
     def is_configured(self) -> bool:
         """Check if Gmail credentials are configured."""
@@ -81,32 +120,41 @@ class GmailSource(EmailSource):
 
     def authenticate(self) -> None:
         """Authenticate with Gmail API using OAuth2."""
-        creds = None
-
-        # Load existing token if available
-        if GMAIL_TOKEN_PATH.exists():
-            creds = Credentials.from_authorized_user_file(str(GMAIL_TOKEN_PATH), GMAIL_SCOPES)
-
-        # If no valid credentials, initiate OAuth flow
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                if not GMAIL_CREDENTIALS_PATH.exists():
-                    raise FileNotFoundError(
-                        f"Gmail credentials not found at {GMAIL_CREDENTIALS_PATH}. "
-                        f"Please download OAuth2 credentials from Google Cloud Console "
-                        f"and save them to this location."
+        with _token_lock:
+            # Load the token inside the lock: if another caller refreshed it while we
+            # waited, the saved token is valid again and no refresh is needed.
+            creds = None
+            if GMAIL_TOKEN_PATH.exists():
+                creds = Credentials.from_authorized_user_file(str(GMAIL_TOKEN_PATH), GMAIL_SCOPES)
+
+            # Only hit the token endpoint when the access token has actually expired;
+            # ``valid`` already allows for clock skew.
+            if not creds or not creds.valid:
+                if creds and creds.expired and creds.refresh_token:
+                    creds.refresh(Request())
+                else:
+                    if not GMAIL_CREDENTIALS_PATH.exists():
+                        raise FileNotFoundError(
+                            f"Gmail credentials not found at {GMAIL_CREDENTIALS_PATH}. "
+                            f"Please download OAuth2 credentials from Google Cloud Console "
+                            f"and save them to this location."
+                        )
+                    flow = InstalledAppFlow.from_client_secrets_file(
+                        str(GMAIL_CREDENTIALS_PATH), GMAIL_SCOPES
                     )
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    str(GMAIL_CREDENTIALS_PATH), GMAIL_SCOPES
-                )
-                creds = flow.run_local_server(port=0)
+                    creds = flow.run_local_server(port=0)
 
-            # Save the credentials for the next run
-            GMAIL_TOKEN_PATH.write_text(creds.to_json())
+                # Save the credentials for the next run
+                _save_token(creds)
 
-        self.service = build('gmail', 'v1', credentials=creds)
+        self._creds = creds
+        # build() wraps the credentials in one AuthorizedHttp whose httplib2
+        # connection is kept alive across calls. The discovery document comes from the
+        # copy bundled with google-api-python-client (static_discovery), so building
+        # the service needs no network round-trip; the file cache is then unused.
+        self.service = build(
+            'gmail', 'v1', credentials=creds, cache_discovery=False, static_discovery=True
+        )
 
     def fetch_unread(self, max_results: int = 10) -> list[RawEmail]:
         """Fetch unread emails from Gmail inbox."""
@@ -121,43 +169,160 @@ class GmailSource(EmailSource):
         ).execute()
 
         messages = results.get('messages', [])
-        raw_emails = []
-
-        for msg in messages:
-            # Fetch full message content
-            message = self.service.users().messages().get(
-                userId='me',
-                id=msg['id'],
-                format='raw'
-            ).execute()
-
-            # Decode the raw message
-            raw_content = base64.urlsafe_b64decode(message['raw'])
-
-            # Parse the email
-            email_msg: EmailMessage = BytesParser(policy=policy.default).parsebytes(raw_content)
-
-            # Extract fields
-            message_id = email_msg.get('Message-Id', '').strip() or f"gmail-{msg['id']}"
-            sender = email_msg.get('From', '').strip()
-            subject = email_msg.get('Subject', '').strip()
-            received_at = email_msg.get('Date', '').strip()
-
-            # Extract body text
-            body_text = self._extract_body(email_msg)
-
-            raw_emails.append(RawEmail(
-                message_id=message_id,
-                sender=sender or None,
-                subject=subject or None,
-                received_at=received_at or None,
-                body_text=body_text,
-                raw_content=raw_content,
-                source_id=msg['id'],
-                source_type='gmail'
-            ))
-
-        return raw_emails
+
+        # Headers are all it takes to tell whether an email is new, so list with
+        # format='metadata' (a few hundred bytes per message); fetch_bodies() downloads
+        # the full message only for the emails that are actually ingested.
+        responses = self._get_messages(
+            [msg['id'] for msg in messages],
+            format='metadata',
+            metadataHeaders=GMAIL_METADATA_HEADERS,
+        )
+        return [
+            self._to_raw_email(msg['id'], responses[msg['id']])
+            for msg in messages
+            if msg['id'] in responses
+        ]
+
+    def fetch_bodies(self, raw_emails: list[RawEmail]) -> None:
+        """Download the full message for each header-only email in ``raw_emails``."""
+        pending = [raw_email for raw_email in raw_emails if raw_email.raw_content is None]
+        if not pending:
+            return
+        if not self.service:
+            self.authenticate()
+
+        def decode(response: dict) -> tuple[bytes, str]:
+            raw_content = _b64.urlsafe_b64decode(response['raw'])
+            return raw_content, extract_plain_text(raw_content)
+
+        # Decode and parse each chunk on a worker thread while the next batch request
+        # is in flight, so CPU work hides behind network latency. Each base64 payload
+        # is popped from its batch's responses as it is queued, so it is released once
+        # decoded rather than held until the next batch has arrived.
+        decoded = {}
+        with ThreadPoolExecutor(max_workers=1) as decoder:
+            source_ids = [raw_email.source_id for raw_email in pending]
+            for responses in self._iter_messages(source_ids, format='raw'):
+                while responses:
+                    source_id, response = responses.popitem()
+                    decoded[source_id] = decoder.submit(decode, response)
+        for raw_email in pending:
+            if raw_email.source_id in decoded:
+                raw_email.raw_content, raw_email.body_text = decoded[raw_email.source_id].result()
+
+    def _get_messages(self, source_ids: list[str], **params) -> dict[str, dict]:
+        """Fetch ``messages().get(**params)`` for each id, returning responses by id."""
+        responses: dict[str, dict] = {}
+        for chunk_responses in self._iter_messages(source_ids, **params):
+            responses.update(chunk_responses)
+        return responses
+
+    def _iter_messages(self, source_ids: list[str], **params) -> Iterator[dict[str, dict]]:
+        """Yield ``messages().get(**params)`` responses by id, one dict per batch.
+
+        Requests go out in batches: one HTTP round-trip per chunk instead of one per
+        message. Messages that no longer exist (deleted since they were listed) are
+        left out of the responses; any other per-message error is raised.
+        """
+        for start in range(0, len(source_ids), GMAIL_BATCH_SIZE):
+            chunk = source_ids[start:start + GMAIL_BATCH_SIZE]
+            responses: dict[str, dict] = {}
+            errors: dict[str, Exception] = {}
+            try:
+                self._fetch_batch(chunk, params, responses, errors)
+            except HttpError as error:
+                # The batch endpoint itself occasionally fails; overlap single
+                # requests instead so the fetch still costs about one round-trip.
+                if error.resp.status not in (400, 404):
+                    raise
+                responses.clear()
+                errors.clear()
+                self._fetch_concurrently(chunk, params, responses, errors)
+            for source_id, error in errors.items():
+                if not (isinstance(error, HttpError) and error.resp.status == 404):
+                    raise error
+                print(f"Skipping Gmail message {source_id}: it no longer exists")
+            yield responses
+
+    def _get_request(self, source_id: str, params: dict):
+        return self.service.users().messages().get(userId='me', id=source_id, **params)
+
+    def _fetch_batch(
+        self,
+        source_ids: list[str],
+        params: dict,
+        responses: dict[str, dict],
+        errors: dict[str, Exception],
+    ) -> None:
+        """Fetch ``source_ids`` with one batch request, storing responses and errors by id.
+
+        Only a failure of the batch request itself is raised.
+        """
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                errors[request_id] = exception
+            else:
+                responses[request_id] = response
+
+        batch = self.service.new_batch_http_request(callback=on_response)
+        for source_id in source_ids:
+            batch.add(self._get_request(source_id, params), request_id=source_id)
+        batch.execute()
+
+    def _fetch_concurrently(
+        self,
+        source_ids: list[str],
+        params: dict,
+        responses: dict[str, dict],
+        errors: dict[str, Exception],
+    ) -> None:
+        """Fetch ``source_ids`` with concurrent single requests, storing responses and
+        HTTP errors by id, as _fetch_batch() does."""
+        def fetch(source_id: str) -> dict | HttpError:
+            try:
+                return self._get_request(source_id, params).execute(http=self._thread_http())
+            except HttpError as error:
+                return error
+
+        with ThreadPoolExecutor(max_workers=min(len(source_ids), GMAIL_FALLBACK_WORKERS)) as executor:
+            for source_id, result in zip(source_ids, executor.map(fetch, source_ids)):
+                if isinstance(result, HttpError):
+                    errors[source_id] = result
+                else:
+                    responses[source_id] = result
+
+    def _thread_http(self):
+        """Return this thread's authorised Http, creating it on first use."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self._local.http = AuthorizedHttp(self._creds, http=httplib2.Http())
+        return http
+
+    def _to_raw_email(self, source_id: str, message: dict) -> RawEmail:
+        """Build a header-only RawEmail from a ``messages().get(format='metadata')`` response."""
+        # Header names are matched case-insensitively (Message-Id vs Message-ID).
+        headers = {
+            header['name'].lower(): header['value']
+            for header in message.get('payload', {}).get('headers', [])
+        }
+
+        # Extract fields
+        message_id = headers.get('message-id', '').strip() or f"gmail-{source_id}"
+        sender = headers.get('from', '').strip()
+        subject = headers.get('subject', '').strip()
+        received_at = headers.get('date', '').strip()
+
+        return RawEmail(
+            message_id=message_id,
+            sender=sender or None,
+            subject=subject or None,
+            received_at=received_at or None,
+            body_text=None,
+            raw_content=None,
+            source_id=source_id,
+            source_type='gmail'
+        )
 
     def mark_as_processed(self, source_id: str) -> None:
         """Mark email as read and add 'PROCESSED' label in Gmail."""
@@ -171,25 +336,6 @@ class GmailSource(EmailSource):
             body={'removeLabelIds': ['UNREAD']}
         ).execute()
 
-    @staticmethod
-    def _extract_body(message: EmailMessage) -> str:
-        """Extract plain text body from email message."""
-        text_parts = []
-        if message.is_multipart():
-            for part in message.walk():
-                if part.get_content_type() == 'text/plain':
-                    try:
-                        text_parts.append(part.get_content())
-                    except Exception:
-                        continue
-        else:
-            try:
-                text_parts.append(message.get_content())
-            except Exception:
-                pass
-
-        return '\n'.join(filter(None, text_parts)).strip()
-
 
 # ============================================================================
 # Factory function
@@ -1,18 +1,30 @@
 """Utilities for parsing and summarising email messages."""
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from email import policy
 from email.message import EmailMessage
 from email.parser import BytesParser
+from email.utils import format_datetime, parsedate_to_datetime
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Iterator, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .email_sources import RawEmail
 
+# Parsers keep no state between parse calls, so one instance serves every message.
+_PARSER = BytesParser(policy=policy.default)
 
-@dataclass
+# Whitespace runs collapsed to one space in snippets, without splitting the body.
+_WHITESPACE = re.compile(r"\s+")
+# Snippets are built from this much of the body; a longer head only matters when it is
+# nearly all whitespace, and then the whole body is used.
+_SNIPPET_SCAN_CHARS = 4096
+
+
+@dataclass(slots=True)
 class ParsedEmail:
     message_id: str
     sender: Optional[str]
@@ -24,46 +36,130 @@ class ParsedEmail:
 
 def parse_email_file(path: Path) -> ParsedEmail:
     """Parse an .eml file and return a lightweight summary."""
-    with path.open("rb") as fp:
-        message: EmailMessage = BytesParser(policy=policy.default).parse(fp)
+    raw = path.read_bytes()
+    message, _ = _parse_headers(raw)
 
     message_id = message.get("Message-Id") or f"local-{path.stem}"
     sender = message.get("From")
     subject = message.get("Subject")
-    received_at = message.get("Date")
+    received_at = normalise_date(message.get("Date"))
 
-    snippet = _extract_snippet(message)
+    snippet = _extract_snippet(extract_plain_text(raw))
 
     return ParsedEmail(
         message_id=message_id.strip(),
         sender=sender.strip() if sender else None,
         subject=subject.strip() if subject else None,
-        received_at=received_at.strip() if received_at else None,
+        received_at=received_at,
         snippet=snippet,
         raw_path=path,
     )
 
 
-def _extract_snippet(message: EmailMessage, max_length: int = 200) -> str:
-    """Get a short snippet from the email body for display."""
-    text_parts = []
-    if message.is_multipart():
-        for part in message.walk():
-            if part.get_content_type() == "text/plain":
-                try:
-                    text_parts.append(part.get_content())
-                except Exception:  # pragma: no cover - defensive
-                    continue
-    else:
+def normalise_date(value: Optional[str]) -> Optional[str]:
+    """Convert an RFC 2822 ``Date`` header to ISO 8601 in UTC.
+
+    Stored timestamps then sort chronologically as plain text, so listings can order
+    by the bare column. Values that do not parse are kept as given.
+    """
+    if not value or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return value
+    if moment.tzinfo is None:  # "-0000": no zone information, taken as UTC
+        moment = moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC).isoformat(timespec="seconds")
+
+
+def display_date(value: Optional[str]) -> Optional[str]:
+    """Format a date stored by normalise_date() as an RFC 2822 date for display.
+
+    Values that are not ISO 8601 (dates that did not parse) are returned as stored.
+    """
+    if not value:
+        return value
+    try:
+        return format_datetime(datetime.fromisoformat(value))
+    except ValueError:
+        return value
+
+
+# End of a header block: a blank line, or a part that starts without headers.
+_HEADER_END = re.compile(rb"\A\r?\n|\r?\n\r?\n")
+
+
+def _parse_headers(raw: bytes) -> tuple[EmailMessage, int]:
+    """Parse only the header block of ``raw``, returning it and where the body starts."""
+    match = _HEADER_END.search(raw)
+    body_start = match.end() if match else len(raw)
+    headers = _PARSER.parsebytes(raw[:body_start], headersonly=True)
+    return headers, body_start
+
+
+def _split_multipart(body: bytes, boundary: str) -> Iterator[bytes]:
+    """Yield the raw bytes of each part of a multipart ``body``."""
+    delimiter = re.compile(
+        rb"(?:\A|\r?\n)--"
+        + re.escape(boundary.encode("ascii", "surrogateescape"))
+        + rb"(--)?[ \t]*(?:\r?\n|\Z)"
+    )
+    start = None
+    for match in delimiter.finditer(body):
+        if start is not None:
+            yield body[start:match.start()]
+        if match.group(1):  # closing delimiter; the epilogue is ignored
+            return
+        start = match.end()
+    if start is not None:  # no closing delimiter: the last part runs to the end
+        yield body[start:]
+
+
+def _iter_text_parts(raw: bytes, top: bool = False) -> Iterator[EmailMessage]:
+    """Yield the ``text/plain`` parts of ``raw`` in order, parsing nothing else.
+
+    Only header blocks are parsed while walking the MIME tree, so HTML alternatives
+    and attachments are skipped over as bytes. Attached ``message/rfc822`` emails are
+    walked too, as ``Message.walk()`` does. A single-part message is yielded for any
+    text type, as the full parser used to do.
+    """
+    headers, body_start = _parse_headers(raw)
+    if headers.get_content_maintype() == "multipart":
+        boundary = headers.get_boundary()
+        if boundary:
+            for part in _split_multipart(raw[body_start:], boundary):
+                yield from _iter_text_parts(part)
+    elif headers.get_content_type() == "message/rfc822":
+        # The body is the attached email itself (RFC 2046 allows no transfer encoding).
+        yield from _iter_text_parts(raw[body_start:])
+    elif headers.get_content_type() == "text/plain" or (
+        top and headers.get_content_maintype() == "text"
+    ):
+        yield _PARSER.parsebytes(raw)
+
+
+def extract_plain_text(raw: bytes) -> str:
+    """Return the body text of an RFC 822 message: its first non-empty text/plain part."""
+    for part in _iter_text_parts(raw, top=True):
         try:
-            text_parts.append(message.get_content())
+            text = part.get_content().strip()
         except Exception:  # pragma: no cover - defensive
-            pass
+            continue
+        if text:
+            return text
+    return ""
 
-    body_text = "\n".join(filter(None, text_parts)).strip()
+
+def _extract_snippet(body_text: str, max_length: int = 200) -> str:
+    """Get a short snippet from the email body for display."""
     if not body_text:
         return ""
-    cleaned = " ".join(body_text.split())
+    head = body_text[:_SNIPPET_SCAN_CHARS]
+    cleaned = _WHITESPACE.sub(" ", head).strip()
+    if len(cleaned) <= max_length and len(body_text) > len(head):
+        cleaned = _WHITESPACE.sub(" ", body_text).strip()
     if len(cleaned) > max_length:
         return cleaned[: max_length - 1] + "…"
     return cleaned
@@ -71,15 +167,13 @@ def _extract_snippet(message: EmailMessage, max_length: int = 200) -> str:
 
 def parse_raw_email(raw_email: RawEmail, storage_path: Path) -> ParsedEmail:
     """Convert a RawEmail object to a ParsedEmail with snippet extraction."""
-    # Create snippet from body text
-    cleaned = " ".join(raw_email.body_text.split())
-    snippet = cleaned[:199] + "…" if len(cleaned) > 200 else cleaned
+    snippet = _extract_snippet(raw_email.body_text)
 
     return ParsedEmail(
         message_id=raw_email.message_id,
         sender=raw_email.sender,
         subject=raw_email.subject,
-        received_at=raw_email.received_at,
+        received_at=normalise_date(raw_email.received_at),
         snippet=snippet,
         raw_path=storage_path,
     )
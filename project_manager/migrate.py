@@ -2,11 +2,35 @@
 from __future__ import annotations
 
 import re
+import sqlite3
+from contextlib import contextmanager, nullcontext
 from email.utils import parseaddr
 
 from . import database
 
 
+# Fast path for the common sender forms: a bare address, or an optional plain or
+# quoted display name followed by <address>. Matches give exactly what parseaddr
+# would; anything else (comments, escapes, groups, odd addresses) goes to parseaddr.
+_ATOM = r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+"
+_ADDR_SPEC = rf"{_ATOM}(?:\.{_ATOM})*@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*"
+_SIMPLE_SENDER = re.compile(
+    rf'\s*(?:(?:"([^"\\]*)"|(\w+(?: \w+)*))\s*)?<({_ADDR_SPEC})>\s*'
+    rf"|\s*({_ADDR_SPEC})\s*"
+)
+
+
+def _parse_sender(sender: str) -> tuple[str, str]:
+    """Equivalent of ``parseaddr(sender)``, without its tokenizer for simple senders."""
+    match = _SIMPLE_SENDER.fullmatch(sender)
+    if match is None:
+        return parseaddr(sender)
+    quoted_name, plain_name, addr, bare_addr = match.groups()
+    if bare_addr is not None:
+        return "", bare_addr
+    return (quoted_name if quoted_name is not None else plain_name or ""), addr
+
+
 def extract_contact_info(sender: str | None) -> tuple[str | None, str | None]:
     """Extract name and email from sender string.
 
@@ -18,8 +42,8 @@ def extract_contact_info(sender: str | None) -> tuple[str | None, str | None]:
     if not sender:
         return None, None
 
-    # Use email.utils.parseaddr for proper RFC parsing
-    name, email = parseaddr(sender)
+    # RFC parsing as email.utils.parseaddr does it
+    name, email = _parse_sender(sender)
 
     # Clean up name (remove quotes, extra whitespace)
     if name:
@@ -36,11 +60,29 @@ def extract_contact_info(sender: str | None) -> tuple[str | None, str | None]:
     return name, email
 
 
+# A known contact only gains a name when it has none, and only then is updated_at
+# touched; RETURNING hands back the id either way.
+_SQL_GET_OR_CREATE_CONTACT = """
+INSERT INTO contacts(name, email)
+VALUES (?, ?)
+ON CONFLICT(email) DO UPDATE SET
+    name = CASE WHEN COALESCE(contacts.name, '') = '' AND COALESCE(excluded.name, '') <> ''
+        THEN excluded.name ELSE contacts.name END,
+    updated_at = CASE WHEN COALESCE(contacts.name, '') = '' AND COALESCE(excluded.name, '') <> ''
+        THEN datetime('now') ELSE contacts.updated_at END
+RETURNING id
+"""
+
+
 def get_or_create_contact(conn, name: str | None, email: str | None) -> int:
     """Get existing contact or create new one. Returns contact_id."""
     if not email and not name:
         raise ValueError("Must provide at least email or name")
 
+    # One upsert where RETURNING is available (SQLite 3.35+)
+    if sqlite3.sqlite_version_info >= (3, 35):
+        return conn.execute(_SQL_GET_OR_CREATE_CONTACT, (name, email)).fetchone()[0]
+
     # Try to find existing contact by email
     if email:
         row = conn.execute(
@@ -67,9 +109,182 @@ def get_or_create_contact(conn, name: str | None, email: str | None) -> int:
     return cursor.lastrowid
 
 
-def migrate_emails_to_communications(dry_run: bool = False) -> dict:
+# Emails read and written per round of the migration.
+MIGRATION_BATCH_SIZE = 1000
+
+# Error messages kept in the stats; later errors are only counted.
+MAX_RECORDED_ERRORS = 100
+
+# Emails without a communication yet. The ORDER BY on created_at makes SQLite sort
+# every matching row before returning the first, so inserting communications while
+# the cursor is open cannot change which emails it yields.
+_PENDING_EMAILS = """
+FROM emails e
+LEFT JOIN communications c ON c.type = 'email' AND c.source_id = e.message_id
+WHERE c.id IS NULL
+"""
+
+# Settings for ``--fast``: skip the commit fsync and foreign-key checks (the rows come
+# from tables that already satisfy them) and give the page cache ~200 MB. A crash
+# during a fast run can corrupt the database; rerunning from a backup is the recovery.
+_BULK_LOAD_PRAGMAS = {
+    "synchronous": "OFF",
+    "foreign_keys": "OFF",
+    "cache_size": "-200000",
+}
+
+
+@contextmanager
+def _bulk_load_pragmas(conn):
+    """Apply _BULK_LOAD_PRAGMAS for the duration of the block, then restore them.
+
+    Must be entered outside a transaction: SQLite ignores foreign_keys inside one.
+    """
+    saved = {name: conn.execute(f"PRAGMA {name}").fetchone()[0] for name in _BULK_LOAD_PRAGMAS}
+    for name, value in _BULK_LOAD_PRAGMAS.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+
+
+def _record_error(stats: dict, message: str) -> None:
+    """Count an error, keeping its message only while fewer than MAX_RECORDED_ERRORS are kept."""
+    stats["errors_total"] += 1
+    if len(stats["errors"]) < MAX_RECORDED_ERRORS:
+        stats["errors"].append(message)
+
+
+def _migrate_batch(conn, emails: list, stats: dict) -> None:
+    """Migrate one batch of email rows, adding to ``stats``.
+
+    The emails are sorted into rows per table in Python, then each table is written
+    with one executemany. If that fails, the batch is rolled back and retried one
+    email at a time, so only the emails that fail are skipped and recorded.
+    """
+    rows = []
+    for email in emails:
+        name, email_addr = extract_contact_info(email["sender"])
+
+        if not email_addr:
+            # Skip emails without valid sender email
+            _record_error(stats, f"Email {email['id']} has no valid sender email")
+            continue
+
+        communication = (
+            "email",
+            None,  # content will be loaded from raw_path when needed
+            email["subject"],
+            email["snippet"],
+            email["received_at"],
+            email["raw_path"],
+            email["message_id"],
+            email["status"],
+            email["remind_at"],
+            email["created_at"],
+            email["updated_at"],
+        )
+        project_link = (
+            (email["project_id"], email["message_id"], email_addr)
+            if email["project_id"]
+            else None
+        )
+        rows.append((email["id"], (name, email_addr), communication, project_link))
+
+    # Nested db_session()s run in savepoints of the migration's transaction.
+    try:
+        with database.db_session():
+            counts = _write_rows(conn, rows)
+    except sqlite3.Error:
+        counts = dict.fromkeys(_ROW_COUNTS, 0)
+        for row in rows:
+            try:
+                with database.db_session():
+                    row_counts = _write_rows(conn, [row])
+            except sqlite3.Error as e:
+                _record_error(stats, f"Error migrating email {row[0]}: {e}")
+                print(f"Error migrating email {row[0]}: {e}")
+                continue
+            for key, count in row_counts.items():
+                counts[key] += count
+
+    for key, count in counts.items():
+        stats[key] += count
+
+
+# Stats counted by _write_rows().
+_ROW_COUNTS = (
+    "contacts_created",
+    "communications_created",
+    "project_links_created",
+    "emails_migrated",
+)
+
+
+def _write_rows(conn, rows: list) -> dict:
+    """Write ``rows`` built by _migrate_batch(), one executemany per table.
+
+    Returns the counts to add to the stats.
+    """
+    contacts = [contact for _, contact, _, _ in rows]
+    communications = [communication for _, _, communication, _ in rows]
+    project_links = [link for _, _, _, link in rows if link is not None]
+
+    # 1. Create contacts; an existing contact (or an earlier email from the same
+    # address) keeps its row, so the first name seen wins.
+    contacts_created = conn.executemany(
+        "INSERT OR IGNORE INTO contacts(name, email) VALUES (?, ?)", contacts
+    ).rowcount
+
+    # 2. Create communications from emails
+    communications_created = conn.executemany(
+        """
+        INSERT INTO communications(
+            type, content, subject, snippet, timestamp, raw_path,
+            source_id, status, remind_at, created_at, updated_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        communications,
+    ).rowcount
+
+    # 3. Link communications to projects. executemany gives no lastrowid, so the
+    # communication and contact ids are looked up in the INSERT itself.
+    project_links_created = conn.executemany(
+        """
+        INSERT INTO project_communications(project_id, communication_id, contact_id)
+        SELECT ?1, c.id, ct.id
+        FROM communications c, contacts ct
+        WHERE c.type = 'email' AND c.source_id = ?2 AND ct.email = ?3
+        """,
+        project_links,
+    ).rowcount
+
+    # Also add contacts to project_contacts if not already there
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO project_contacts(project_id, contact_id)
+        SELECT ?1, id FROM contacts WHERE email = ?3
+        """,
+        project_links,
+    )
+
+    return {
+        "contacts_created": contacts_created,
+        "communications_created": communications_created,
+        "project_links_created": project_links_created,
+        "emails_migrated": len(communications),
+    }
+
+
+def migrate_emails_to_communications(dry_run: bool = False, fast: bool = False) -> dict:
     """Migrate existing emails to new schema.
 
+    ``fast`` trades crash safety for speed for the duration of the migration; see
+    _BULK_LOAD_PRAGMAS.
+
     Returns statistics about the migration.
     """
     stats = {
@@ -77,113 +292,48 @@ def migrate_emails_to_communications(dry_run: bool = False) -> dict:
         "contacts_created": 0,
         "communications_created": 0,
         "project_links_created": 0,
-        "errors": []
+        "errors": [],  # the first MAX_RECORDED_ERRORS messages
+        "errors_total": 0,
     }
 
-    with database.db_session() as conn:
-        # Get all emails that haven't been migrated yet
-        emails = conn.execute(
-            """
-            SELECT e.* FROM emails e
-            WHERE NOT EXISTS (
-                SELECT 1 FROM communications c
-                WHERE c.type = 'email' AND c.source_id = e.message_id
-            )
-            ORDER BY e.created_at
-            """
-        ).fetchall()
-
-        print(f"Found {len(emails)} emails to migrate")
+    # The whole migration runs in one transaction (db_session's BEGIN IMMEDIATE), so
+    # rows cost no commit each and an interrupted run leaves nothing half-migrated.
+    # A dry run only reads.
+    bulk_load = (
+        _bulk_load_pragmas(database.get_shared_connection())
+        if fast and not dry_run
+        else nullcontext()
+    )
+    with bulk_load, database.db_session(read_only=dry_run) as conn:
+        # Get all emails that haven't been migrated yet. Rows are read and written
+        # in batches, so memory stays flat however large the emails table is.
+        (count,) = conn.execute(f"SELECT COUNT(*) {_PENDING_EMAILS}").fetchone()
+        emails = conn.execute(f"SELECT e.* {_PENDING_EMAILS} ORDER BY e.created_at")
+
+        print(f"Found {count} emails to migrate")
 
         if dry_run:
             print("DRY RUN - No changes will be made")
 
             # Show sample of what would be created
-            for email in emails[:5]:
+            # One print per email rather than one per line
+            for email in emails.fetchmany(5):
                 name, email_addr = extract_contact_info(email["sender"])
-                print(f"\nEmail: {email['subject']}")
-                print(f"  From: {email['sender']}")
-                print(f"  -> Would create contact: name={name}, email={email_addr}")
-                print(f"  -> Would create communication: type=email, status={email['status']}")
+                lines = [
+                    f"\nEmail: {email['subject']}",
+                    f"  From: {email['sender']}",
+                    f"  -> Would create contact: name={name}, email={email_addr}",
+                    f"  -> Would create communication: type=email, status={email['status']}",
+                ]
                 if email['project_id']:
-                    print(f"  -> Would link to project {email['project_id']}")
+                    lines.append(f"  -> Would link to project {email['project_id']}")
+                print("\n".join(lines))
 
             return stats
 
         # Actual migration
-        for email in emails:
-            try:
-                # 1. Extract and create/get contact
-                name, email_addr = extract_contact_info(email["sender"])
-
-                if not email_addr:
-                    # Skip emails without valid sender email
-                    stats["errors"].append(f"Email {email['id']} has no valid sender email")
-                    continue
-
-                # Check if contact already exists
-                existing_contact = conn.execute(
-                    "SELECT id FROM contacts WHERE email = ?", (email_addr,)
-                ).fetchone()
-
-                if existing_contact:
-                    contact_id = existing_contact["id"]
-                else:
-                    contact_id = get_or_create_contact(conn, name, email_addr)
-                    stats["contacts_created"] += 1
-
-                # 2. Create communication from email
-                cursor = conn.execute(
-                    """
-                    INSERT INTO communications(
-                        type, content, subject, snippet, timestamp, raw_path,
-                        source_id, status, remind_at, created_at, updated_at
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        "email",
-                        None,  # content will be loaded from raw_path when needed
-                        email["subject"],
-                        email["snippet"],
-                        email["received_at"],
-                        email["raw_path"],
-                        email["message_id"],
-                        email["status"],
-                        email["remind_at"],
-                        email["created_at"],
-                        email["updated_at"]
-                    )
-                )
-                communication_id = cursor.lastrowid
-                stats["communications_created"] += 1
-
-                # 3. Link communication to project (if assigned)
-                if email["project_id"]:
-                    conn.execute(
-                        """
-                        INSERT INTO project_communications(project_id, communication_id, contact_id)
-                        VALUES (?, ?, ?)
-                        """,
-                        (email["project_id"], communication_id, contact_id)
-                    )
-                    stats["project_links_created"] += 1
-
-                    # Also add contact to project_contacts if not already there
-                    conn.execute(
-                        """
-                        INSERT OR IGNORE INTO project_contacts(project_id, contact_id)
-                        VALUES (?, ?)
-                        """,
-                        (email["project_id"], contact_id)
-                    )
-
-                stats["emails_migrated"] += 1
-
-            except Exception as e:
-                stats["errors"].append(f"Error migrating email {email['id']}: {e}")
-                print(f"Error migrating email {email['id']}: {e}")
-                continue
+        while batch := emails.fetchmany(MIGRATION_BATCH_SIZE):
+            _migrate_batch(conn, batch, stats)
 
     return stats
 
@@ -198,12 +348,13 @@ def print_migration_stats(stats: dict) -> None:
     print(f"Communications created: {stats['communications_created']}")
     print(f"Project links created:  {stats['project_links_created']}")
 
-    if stats['errors']:
-        print(f"\nErrors encountered:     {len(stats['errors'])}")
-        for error in stats['errors'][:10]:  # Show first 10 errors
+    if stats['errors_total']:
+        print(f"\nErrors encountered:     {stats['errors_total']}")
+        shown = stats['errors'][:10]  # Show first 10 errors
+        for error in shown:
             print(f"  - {error}")
-        if len(stats['errors']) > 10:
-            print(f"  ... and {len(stats['errors']) - 10} more")
+        if stats['errors_total'] > len(shown):
+            print(f"  ... and {stats['errors_total'] - len(shown)} more")
     else:
         print("\nNo errors encountered!")
     print("="*50 + "\n")
@@ -214,14 +365,17 @@ def main():
     import sys
 
     dry_run = "--dry-run" in sys.argv
+    fast = "--fast" in sys.argv
 
     print("Starting migration from emails to communications schema...")
 
     # Initialize database (creates new tables if needed)
-    database.initialize()
+    from .app import upgrade_stored_data
+
+    database.initialize(upgrade_data=upgrade_stored_data)
 
     # Run migration
-    stats = migrate_emails_to_communications(dry_run=dry_run)
+    stats = migrate_emails_to_communications(dry_run=dry_run, fast=fast)
 
     # Print results
     print_migration_stats(stats)
@@ -4,11 +4,13 @@ from __future__ import annotations
 import os
 import sqlite3
 from datetime import datetime, UTC
+from functools import lru_cache
 from pathlib import Path
 
 from flask import Flask, flash, redirect, render_template, request, url_for
 
 from .app import ProjectManager, REMINDER_OFFSETS, iter_pending_emails
+from .email_utils import display_date
 
 
 def create_app() -> Flask:
@@ -25,7 +27,10 @@ def create_app() -> Flask:
     def inject_constants():
         return {"REMINDER_OFFSETS": REMINDER_OFFSETS}
 
+    # Pure function of the string, and the same remind_at values come back on every
+    # render of the index page; datetimes are immutable, so sharing them is safe.
     @app.template_filter("parse_iso")
+    @lru_cache(maxsize=4096)
     def parse_iso(value: str | None):
         if not value:
             return None
@@ -34,9 +39,12 @@ def create_app() -> Flask:
         except ValueError:
             return None
 
+    app.template_filter("display_date")(display_date)
+
     @app.route("/")
     def index():
-        emails = iter_pending_emails(manager)
+        # The template tests the list for emptiness before iterating it.
+        emails = list(iter_pending_emails(manager))
         projects = manager.list_projects()
         return render_template(
             "index.html",
@@ -81,13 +89,13 @@ def create_app() -> Flask:
             flash("Invalid project selection.", "error")
             return redirect(url_for("index"))
 
-        projects = {project.id: project for project in manager.list_projects()}
-        if project_id_int not in projects:
+        project = manager.get_project(project_id_int)
+        if project is None:
             flash("Selected project no longer exists.", "error")
             return redirect(url_for("index"))
 
-        manager.set_email_project(email_id, project_id_int)
-        flash(f"Email assigned to {projects[project_id_int].name}.", "success")
+        manager.set_email_project(email_id, project.id)
+        flash(f"Email assigned to {project.name}.", "success")
         return redirect(url_for("index"))
 
     @app.post("/emails/<int:email_id>/create-project")
@@ -119,12 +127,12 @@ def create_app() -> Flask:
             flash("Email could not be found.", "error")
             return redirect(url_for("index"))
 
-        interval = request.form.get("interval")
-        if interval not in REMINDER_OFFSETS:
+        offset = REMINDER_OFFSETS.get(request.form.get("interval"))
+        if offset is None:
             flash("Select how long to snooze the email.", "error")
             return redirect(url_for("index"))
 
-        label, delta = REMINDER_OFFSETS[interval]
+        label, delta = offset
 
         remind_at = datetime.now(UTC) + delta
         manager.set_email_snooze(email_id, remind_at)
@@ -142,8 +150,9 @@ def create_app() -> Flask:
             return redirect(url_for("index"))
 
         if entry.sender:
-            manager.ignore_sender(entry.sender)
-        manager.set_email_ignored(email_id)
+            manager.ignore_sender_and_emails(entry.sender, email_id)
+        else:
+            manager.set_email_ignored(email_id)
         flash("Sender ignored and email removed from triage.", "success")
         return redirect(url_for("index"))
 